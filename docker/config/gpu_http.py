@@ -1,9 +1,14 @@
+import asyncio
 from multiprocessing import Process
+from threading import Thread
 
+from inference.core import logger
 from inference.core.cache import cache
 from inference.core.env import (
     MAX_ACTIVE_MODELS,
     ACTIVE_LEARNING_ENABLED,
+    INFERENCE_MODEL_IDLE_SECS,
+    INFERENCE_USE_MP,
     LAMBDA,
     ENABLE_STREAM_API,
 )
@@ -22,10 +27,15 @@ from inference.models.utils import ROBOFLOW_MODEL_TYPES
 
 
 if ENABLE_STREAM_API:
-    stream_manager_process = Process(
-        target=start,
-    )
-    stream_manager_process.start()
+    if INFERENCE_USE_MP:
+        stream_manager_process = Process(
+            target=start,
+        )
+        stream_manager_process.start()
+    else:
+        # in-process fallback for small single-worker deployments - saves a
+        # fork and a second Python interpreter
+        Thread(target=start, daemon=True).start()
 
 model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
 
@@ -47,3 +57,19 @@ interface = HttpInterface(
     model_manager,
 )
 app = interface.app
+
+if INFERENCE_MODEL_IDLE_SECS > 0:
+
+    @app.on_event("startup")
+    async def schedule_idle_models_eviction():
+        async def evict_idle_models():
+            while True:
+                await asyncio.sleep(INFERENCE_MODEL_IDLE_SECS)
+                try:
+                    model_manager.evict_idle(ttl_secs=INFERENCE_MODEL_IDLE_SECS)
+                except Exception as error:
+                    # the task has no supervisor - swallow the error so one
+                    # failed sweep does not kill eviction for good
+                    logger.warning(f"Idle models eviction failed: {error}")
+
+        asyncio.create_task(evict_idle_models())
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from inference.core import logger
 
@@ -71,6 +71,33 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def zrangebyscore_many(
+        self,
+        keys: List[str],
+        min: Optional[float] = -1,
+        max: Optional[float] = float("inf"),
+        withscores: bool = False,
+    ) -> List[list]:
+        """
+        Retrieves ranges of members from multiple sorted sets.
+
+        Backends capable of batching should override this method to fetch all
+        ranges in a single round trip.
+
+        Args:
+            keys (List[str]): The keys of the sorted sets.
+            min (float, optional): The minimum score of the range. Defaults to -1.
+            max (float, optional): The maximum score of the range. Defaults to float("inf").
+            withscores (bool, optional): Whether to return the scores along with the values. Defaults to False.
+
+        Returns:
+            list: A list with one result list per key, in the order of `keys`.
+        """
+        return [
+            self.zrangebyscore(key, min=min, max=max, withscores=withscores)
+            for key in keys
+        ]
+
     def zremrangebyscore(
         self,
         key: str,
@@ -420,12 +420,41 @@ WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE = int(
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS", "8")
 )
+WORKFLOWS_STEP_BATCHING_MAX_BATCH_SIZE = int(
+    os.getenv("WORKFLOWS_STEP_BATCHING_MAX_BATCH_SIZE", "8")
+)
+WORKFLOWS_STEP_BATCHING_MAX_WAIT_MS = float(
+    os.getenv("WORKFLOWS_STEP_BATCHING_MAX_WAIT_MS", "0")
+)
 ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS = str2bool(
     os.getenv("ALLOW_CUSTOM_PYTHON_EXECUTION_IN_WORKFLOWS", True)
 )
 
 MODEL_VALIDATION_DISABLED = str2bool(os.getenv("MODEL_VALIDATION_DISABLED", "False"))
 
+# When disabled, auxiliary services (like the stream manager) run on
+# background threads instead of separate processes - avoids the fork and
+# extra interpreter for small single-worker deployments
+INFERENCE_USE_MP = str2bool(os.getenv("INFERENCE_USE_MP", "True"))
+
+# Approximate budget (in MB) for weights of models kept in the in-memory
+# cache - least utilized models are evicted once the sum of on-disk weights
+# sizes of resident models exceeds it; 0 disables the byte budget
+INFERENCE_MODEL_CACHE_MB = float(os.getenv("INFERENCE_MODEL_CACHE_MB", "8192"))
+
+# Idle time (in seconds) after which unused models are evicted from the
+# in-memory cache; 0 disables idle eviction
+INFERENCE_MODEL_IDLE_SECS = float(os.getenv("INFERENCE_MODEL_IDLE_SECS", "300"))
+
+# Comma-separated URLs of all inference server replicas - when set, requests
+# carrying `model_id` are redirected to the replica owning the model hash
+MODEL_ROUTING_REPLICAS = [
+    url.strip()
+    for url in os.getenv("MODEL_ROUTING_REPLICAS", "").split(",")
+    if url.strip()
+]
+MODEL_ROUTING_SELF_URL = os.getenv("MODEL_ROUTING_SELF_URL")
+
 INFERENCE_WARNINGS_DISABLED = str2bool(
     os.getenv("INFERENCE_WARNINGS_DISABLED", "False")
 )
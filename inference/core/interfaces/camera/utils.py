@@ -74,7 +74,7 @@ def get_video_frames_generator(
         ```
     """
     is_managed_source = False
-    if issubclass(type(video), str) or issubclass(type(video), int):
+    if isinstance(video, (str, int)):
         video = VideoSource.init(
             video_reference=video,
         )
@@ -358,7 +358,7 @@ def _prepare_video_sources(
     minimal_free_source_id = _find_free_source_identifier(videos=videos)
     try:
         for video in videos:
-            if issubclass(type(video), str) or issubclass(type(video), int):
+            if isinstance(video, (str, int)):
                 video = VideoSource.init(
                     video_reference=video, source_id=minimal_free_source_id
                 )
@@ -391,7 +391,7 @@ def _find_free_source_identifier(videos: List[Union[VideoSource, str, int]]) ->
     minimal_free_source_id = [
         v.source_id if v.source_id is not None else -1
         for v in videos
-        if issubclass(type(v), VideoSource)
+        if isinstance(v, VideoSource)
     ]
     if len(minimal_free_source_id) == 0:
         minimal_free_source_id = -1
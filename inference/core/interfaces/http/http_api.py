@@ -121,6 +121,7 @@ from inference.core.env import (
     LMM_ENABLED,
     METLO_KEY,
     METRICS_ENABLED,
+    MODEL_ROUTING_REPLICAS,
     NOTEBOOK_ENABLED,
     NOTEBOOK_PASSWORD,
     NOTEBOOK_PORT,
@@ -160,6 +161,9 @@ from inference.core.interfaces.http.handlers.workflows import (
     handle_describe_workflows_interface,
 )
 from inference.core.interfaces.http.middlewares.gzip import gzip_response_if_requested
+from inference.core.interfaces.http.middlewares.model_routing import (
+    ModelRoutingMiddleware,
+)
 from inference.core.interfaces.http.orjson_utils import orjson_response
 from inference.core.interfaces.stream_manager.api.entities import (
     CommandResponse,
@@ -519,6 +523,9 @@ class HttpInterface(BaseInterface):
         if LAMBDA:
             app.add_middleware(LambdaMiddleware)
 
+        if MODEL_ROUTING_REPLICAS:
+            app.add_middleware(ModelRoutingMiddleware)
+
         if len(ALLOW_ORIGINS) > 0:
             app.add_middleware(
                 CORSMiddleware,
@@ -1450,6 +1457,7 @@ class HttpInterface(BaseInterface):
                 return await self.stream_manager_client.consume_pipeline_result(
                     pipeline_id=pipeline_id,
                     excluded_fields=request.excluded_fields,
+                    include_images=request.include_images,
                 )
 
         if CORE_MODELS_ENABLED:
@@ -1661,7 +1669,10 @@ class HttpInterface(BaseInterface):
 
                 @app.post(
                     "/doctr/ocr",
-                    response_model=OCRInferenceResponse,
+                    response_model=Union[
+                        OCRInferenceResponse,
+                        List[OCRInferenceResponse],
+                    ],
                     summary="DocTR OCR response",
                     description="Run the DocTR OCR model to retrieve text in an image.",
                 )
@@ -1683,7 +1694,9 @@ class HttpInterface(BaseInterface):
                         request (Request, default Body()): The HTTP request.
 
                     Returns:
-                        M.OCRInferenceResponse: The response containing the embedded image.
+                        M.OCRInferenceResponse: The response containing the text
+                            retrieved from the image (a list of responses for
+                            batch requests).
                     """
                     logger.debug(f"Reached /doctr/ocr")
                     doctr_model_id = load_doctr_model(
@@ -0,0 +1,80 @@
+import zlib
+from typing import List, Optional
+
+import orjson
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from inference.core.env import MODEL_ROUTING_REPLICAS, MODEL_ROUTING_SELF_URL
+
+
+class ModelRoutingMiddleware:
+    """Routes model-bound requests to the replica owning the model weights.
+
+    When several inference server replicas sit behind a random load balancer,
+    each replica ends up loading the same models into its `WithFixedSizeCache`,
+    paying the cold-start cost once per replica. This middleware hashes the
+    `model_id` found in the request body and redirects (HTTP 307, which
+    preserves method and body) to the replica the hash points at, so a given
+    model is preferentially served - and cached - by a single replica.
+
+    Enabled by listing all replica URLs in `MODEL_ROUTING_REPLICAS` and
+    identifying this replica via `MODEL_ROUTING_SELF_URL`. Requests without a
+    parsable `model_id`, or owned by this replica, are handled locally.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        replicas: Optional[List[str]] = None,
+        self_url: Optional[str] = None,
+    ):
+        self._app = app
+        replicas = replicas if replicas is not None else MODEL_ROUTING_REPLICAS
+        self._replicas = [replica.rstrip("/") for replica in replicas]
+        self._self_url = (self_url or MODEL_ROUTING_SELF_URL or "").rstrip("/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "POST"
+            or not self._replicas
+        ):
+            await self._app(scope, receive, send)
+            return
+        messages = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            messages.append(message)
+            more_body = message.get("more_body", False)
+        body = b"".join(message.get("body", b"") for message in messages)
+        target_replica = self._choose_replica(body=body)
+        if target_replica is not None and target_replica != self._self_url:
+            url = f"{target_replica}{scope['path']}"
+            query_string = scope.get("query_string", b"")
+            if query_string:
+                url = f"{url}?{query_string.decode()}"
+            response = RedirectResponse(url=url, status_code=307)
+            await response(scope, receive, send)
+            return
+
+        async def replay_body() -> dict:
+            if messages:
+                return messages.pop(0)
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        await self._app(scope, replay_body, send)
+
+    def _choose_replica(self, body: bytes) -> Optional[str]:
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        model_id = payload.get("model_id")
+        if not isinstance(model_id, str) or not model_id:
+            return None
+        replica_index = zlib.crc32(model_id.encode("utf-8")) % len(self._replicas)
+        return self._replicas[replica_index]
@@ -11,6 +11,7 @@ from inference.core.utils.image_utils import ImageType
 from inference.core.workflows.core_steps.common.serializers import (
     serialize_wildcard_kind,
 )
+from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
 
 
 class ORJSONResponseBytes(ORJSONResponse):
@@ -67,6 +68,7 @@ def serialise_workflow_result(
 def serialise_single_workflow_result_element(
     result_element: Dict[str, Any],
     excluded_fields: Optional[List[str]] = None,
+    include_images: bool = True,
 ) -> Dict[str, Any]:
     if excluded_fields is None:
         excluded_fields = []
@@ -75,6 +77,10 @@ def serialise_single_workflow_result_element(
     for key, value in result_element.items():
         if key in excluded_fields:
             continue
+        if not include_images and isinstance(value, WorkflowImageData):
+            # base64-encoding output images dominates serialisation cost -
+            # consumers interested only in predictions / metadata can opt out
+            continue
         serialised_result[key] = serialize_wildcard_kind(value=value)
     return serialised_result
 
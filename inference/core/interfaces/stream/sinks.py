@@ -26,7 +26,7 @@ ImageWithSourceID = Tuple[Optional[int], np.ndarray]
 
 
 def display_image(image: Union[ImageWithSourceID, List[ImageWithSourceID]]) -> None:
-    if issubclass(type(image), list):
+    if isinstance(image, list):
         tiles = create_tiles(images=[i[1] for i in image])
         cv2.imshow("Predictions - tiles", tiles)
     else:
@@ -515,7 +515,7 @@ class VideoFileSink:
     ) -> None:
         if self._video_writer is None:
             self._initialise_sink()
-        if issubclass(type(frame), list):
+        if isinstance(frame, list):
             frame = create_tiles(images=[i[1] for i in frame])
         else:
             frame = frame[1]
@@ -52,7 +52,7 @@ def prepare_video_sources(
 
 
 def wrap_in_list(element: Union[T, List[T]]) -> List[T]:
-    if not issubclass(type(element), list):
+    if not isinstance(element, list):
         element = [element]
     return element
 
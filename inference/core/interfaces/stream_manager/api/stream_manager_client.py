@@ -109,7 +109,9 @@ class StreamManagerClient:
     async def initialise_webrtc_pipeline(
         self, initialisation_request: InitialiseWebRTCPipelinePayload
     ) -> InitializeWebRTCPipelineResponse:
-        command = initialisation_request.dict(exclude_none=True)
+        # model_dump goes straight to pydantic v2 serialisation instead of
+        # the deprecated .dict() compatibility shim
+        command = initialisation_request.model_dump(exclude_none=True)
         command[TYPE_KEY] = CommandType.WEBRTC
         response = await self._handle_command(command=command)
         status = response[RESPONSE_KEY][STATUS_KEY]
@@ -127,7 +129,7 @@ class StreamManagerClient:
     async def initialise_pipeline(
         self, initialisation_request: InitialisePipelinePayload
     ) -> CommandResponse:
-        command = initialisation_request.dict(exclude_none=True)
+        command = initialisation_request.model_dump(exclude_none=True)
         command[TYPE_KEY] = CommandType.INIT
         response = await self._handle_command(command=command)
         return build_response(response=response)
@@ -178,11 +180,13 @@ class StreamManagerClient:
         self,
         pipeline_id: str,
         excluded_fields: List[str],
+        include_images: bool = True,
     ) -> ConsumePipelineResponse:
         command = {
             TYPE_KEY: CommandType.CONSUME_RESULT,
             PIPELINE_ID_KEY: pipeline_id,
             "excluded_fields": excluded_fields,
+            "include_images": include_images,
         }
         response = await self._handle_command(command=command)
         status = response[RESPONSE_KEY][STATUS_KEY]
@@ -2,6 +2,7 @@ import os
 import signal
 import socket
 import sys
+import threading
 import time
 import uuid
 from functools import partial
@@ -283,10 +284,13 @@ def execute_termination(
     processes_table: Dict[str, Tuple[Process, Queue, Queue, Lock]],
 ) -> None:
     pipeline_ids = list(processes_table.keys())
+    # signal every pipeline first and only then join - shutdowns overlap, so
+    # total termination time is the slowest pipeline, not the sum of all
     for pipeline_id in pipeline_ids:
         logger.info(f"Terminating pipeline: {pipeline_id}")
         processes_table[pipeline_id][0].terminate()
         logger.info(f"Pipeline: {pipeline_id} terminated.")
+    for pipeline_id in pipeline_ids:
         logger.info(f"Joining pipeline: {pipeline_id}")
         processes_table[pipeline_id][0].join()
         logger.info(f"Pipeline: {pipeline_id} joined.")
@@ -362,12 +366,17 @@ def check_process_health() -> None:
 
 
 def start() -> None:
-    signal.signal(
-        signal.SIGINT, partial(execute_termination, processes_table=PROCESSES_TABLE)
-    )
-    signal.signal(
-        signal.SIGTERM, partial(execute_termination, processes_table=PROCESSES_TABLE)
-    )
+    if threading.current_thread() is threading.main_thread():
+        # signal handlers can only be registered from the main thread - when
+        # running in-process on a background thread, the hosting application
+        # owns process termination
+        signal.signal(
+            signal.SIGINT, partial(execute_termination, processes_table=PROCESSES_TABLE)
+        )
+        signal.signal(
+            signal.SIGTERM,
+            partial(execute_termination, processes_table=PROCESSES_TABLE),
+        )
 
     # check process health in daemon thread
     Thread(target=check_process_health, daemon=True).start()
@@ -111,3 +111,8 @@ class ConsumeResultsPayload(BaseModel):
         default_factory=list,
         description="List of workflow output fields to be filtered out from response",
     )
+    include_images: bool = Field(
+        default=True,
+        description="Flag to disable serialisation of image outputs - set False when "
+        "only predictions and metadata are needed, to skip base64 encoding",
+    )
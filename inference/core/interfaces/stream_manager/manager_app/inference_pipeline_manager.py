@@ -467,6 +467,7 @@ class InferencePipelineManager(Process):
                 self._responses_queue.put((request_id, response_payload))
                 return None
             excluded_fields = payload.get("excluded_fields")
+            include_images = payload.get("include_images", True)
             predictions, frames = self._buffer_sink.consume_prediction()
             self._last_consume_time = time.monotonic()
             predictions = [
@@ -474,6 +475,7 @@ class InferencePipelineManager(Process):
                     serialise_single_workflow_result_element(
                         result_element=result_element,
                         excluded_fields=excluded_fields,
+                        include_images=include_images,
                     )
                     if result_element is not None
                     else None
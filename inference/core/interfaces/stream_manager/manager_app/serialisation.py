@@ -18,7 +18,7 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
 def serialise_to_json(obj: Any) -> Any:
     if isinstance(obj, (datetime, date)):
         return obj.isoformat()
-    if issubclass(type(obj), Enum):
+    if isinstance(obj, Enum):
         return obj.value
     raise TypeError(f"Type {type(obj)} not serializable")
 
@@ -130,9 +130,9 @@ class ActiveLearningManager(ModelManager):
                 "Could not register datapoint, as inference input has no `image` field."
             )
             return None
-        if not issubclass(type(inference_inputs), list):
+        if not isinstance(inference_inputs, list):
             inference_inputs = [inference_inputs]
-        if not issubclass(type(prediction), list):
+        if not isinstance(prediction, list):
             results_dicts = [prediction.dict(by_alias=True, exclude={"visualization"})]
         else:
             results_dicts = [
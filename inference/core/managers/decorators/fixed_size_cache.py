@@ -1,17 +1,41 @@
-from collections import deque
-from typing import List, Optional
+import os
+import time
+from typing import Dict, List, Optional
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import INFERENCE_MODEL_CACHE_MB
 from inference.core.managers.base import Model, ModelManager
 from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.managers.entities import ModelDescription
 
+COUNTER_SATURATION_THRESHOLD = 1 << 20
+MODEL_WEIGHTS_EXTENSIONS = (".safetensors", ".onnx", ".bin")
+
+
+def estimate_model_size(model_dir: str) -> int:
+    """Sums sizes (in bytes) of model weights artifacts found under `model_dir`."""
+    total_bytes = 0
+    if not model_dir or not os.path.isdir(model_dir):
+        return total_bytes
+    for directory, _, files in os.walk(model_dir):
+        for file_name in files:
+            if not file_name.endswith(MODEL_WEIGHTS_EXTENSIONS):
+                continue
+            try:
+                total_bytes += os.path.getsize(os.path.join(directory, file_name))
+            except OSError:
+                continue
+    return total_bytes
+
 
 class WithFixedSizeCache(ModelManagerDecorator):
     def __init__(self, model_manager: ModelManager, max_size: int = 8):
-        """Cache decorator, models will be evicted based on the last utilization (`.infer` call). Internally, a [double-ended queue](https://docs.python.org/3/library/collections.html#collections.deque) is used to keep track of model utilization.
+        """Cache decorator, models are evicted based on utilization (`.infer` calls). Internally, a
+        per-model access counter is incremented on every use and the model with the smallest count
+        is evicted when the cache is full - a hit is a single dict increment, with no queue
+        reshuffling on the hot path.
 
         Args:
             model_manager (ModelManager): Instance of a ModelManager.
@@ -19,12 +43,19 @@ class WithFixedSizeCache(ModelManagerDecorator):
         """
         super().__init__(model_manager)
         self.max_size = max_size
-        self._key_queue = deque(self.model_manager.keys())
+        self._access_counts: Dict[str, int] = {
+            key: 1 for key in self.model_manager.keys()
+        }
+        self._last_access: Dict[str, float] = {
+            key: time.monotonic() for key in self._access_counts
+        }
+        self._model_sizes: Dict[str, int] = {}
+        self._memory_budget_bytes = int(INFERENCE_MODEL_CACHE_MB * 1024 * 1024)
 
     def add_model(
         self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
     ) -> None:
-        """Adds a model to the manager and evicts the least recently used if the cache is full.
+        """Adds a model to the manager and evicts the least utilized if the cache is full.
 
         Args:
             model_id (str): The identifier of the model.
@@ -35,30 +66,38 @@ class WithFixedSizeCache(ModelManagerDecorator):
         )
         if queue_id in self:
             logger.debug(
-                f"Detected {queue_id} in WithFixedSizeCache models queue -> marking as most recently used."
+                f"Detected {queue_id} in WithFixedSizeCache models registry -> bumping usage counter."
             )
-            self._key_queue.remove(queue_id)
-            self._key_queue.append(queue_id)
+            self._mark_model_usage(queue_id)
             return None
 
         logger.debug(f"Current capacity of ModelManager: {len(self)}/{self.max_size}")
-        while len(self) >= self.max_size:
-            to_remove_model_id = self._key_queue.popleft()
+        while self._access_counts and (
+            len(self) >= self.max_size or self._memory_budget_exceeded()
+        ):
+            to_remove_model_id = min(self._access_counts, key=self._access_counts.get)
             logger.debug(
-                f"Reached maximum capacity of ModelManager. Unloading model {to_remove_model_id}"
+                f"Reached capacity limits of ModelManager. Unloading model {to_remove_model_id}"
             )
             super().remove(to_remove_model_id)
+            self._access_counts.pop(to_remove_model_id, None)
+            self._last_access.pop(to_remove_model_id, None)
+            self._model_sizes.pop(to_remove_model_id, None)
             logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
-        logger.debug(f"Marking new model {queue_id} as most recently used.")
-        self._key_queue.append(queue_id)
+        logger.debug(f"Registering new model {queue_id} in usage counters.")
+        self._access_counts[queue_id] = 1
+        self._last_access[queue_id] = time.monotonic()
         try:
-            return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            result = super().add_model(model_id, api_key, model_id_alias=model_id_alias)
         except Exception as error:
             logger.debug(
-                f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models queue."
+                f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models registry."
             )
-            self._key_queue.remove(queue_id)
+            self._access_counts.pop(queue_id, None)
+            self._last_access.pop(queue_id, None)
             raise error
+        self._register_model_size(queue_id=queue_id)
+        return result
 
     def clear(self) -> None:
         """Removes all models from the manager."""
@@ -66,14 +105,39 @@ class WithFixedSizeCache(ModelManagerDecorator):
             self.remove(model_id)
 
     def remove(self, model_id: str) -> Model:
-        try:
-            self._key_queue.remove(model_id)
-        except ValueError:
+        if self._access_counts.pop(model_id, None) is None:
             logger.warning(
-                f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
+                f"Could not successfully purge model {model_id} from WithFixedSizeCache models registry"
             )
+        self._last_access.pop(model_id, None)
+        self._model_sizes.pop(model_id, None)
         return super().remove(model_id)
 
+    def evict_idle(self, ttl_secs: float) -> List[str]:
+        """Evicts models that were not utilized for more than `ttl_secs` seconds.
+
+        Reclaims memory held by models loaded during a traffic burst and untouched
+        since; an idle deployment otherwise pins the weights in RAM forever.
+
+        Args:
+            ttl_secs (float): Idle time after which a model is unloaded.
+
+        Returns:
+            List[str]: Identifiers of the evicted models.
+        """
+        now = time.monotonic()
+        # snapshot the items - request threads insert keys concurrently and
+        # iterating the live dict would raise RuntimeError mid-sweep
+        idle_model_ids = [
+            model_id
+            for model_id, last_access in list(self._last_access.items())
+            if now - last_access > ttl_secs
+        ]
+        for model_id in idle_model_ids:
+            logger.debug(f"Evicting idle model {model_id}.")
+            self.remove(model_id)
+        return idle_model_ids
+
     async def infer_from_request(
         self, model_id: str, request: InferenceRequest, **kwargs
     ) -> InferenceResponse:
@@ -86,8 +150,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_model_usage(model_id)
         return await super().infer_from_request(model_id, request, **kwargs)
 
     def infer_from_request_sync(
@@ -102,8 +165,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_model_usage(model_id)
         return super().infer_from_request_sync(model_id, request, **kwargs)
 
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
@@ -119,8 +181,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             Response from the inference-only operation.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_model_usage(model_id)
         return super().infer_only(model_id, request, img_in, img_dims, batch_size)
 
     def preprocess(self, model_id: str, request):
@@ -130,13 +191,36 @@ class WithFixedSizeCache(ModelManagerDecorator):
             model_id (str): The identifier of the model.
             request (InferenceRequest): The request to preprocess.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._mark_model_usage(model_id)
         return super().preprocess(model_id, request)
 
     def describe_models(self) -> List[ModelDescription]:
         return self.model_manager.describe_models()
 
+    def _memory_budget_exceeded(self) -> bool:
+        if self._memory_budget_bytes <= 0:
+            return False
+        return sum(self._model_sizes.values()) > self._memory_budget_bytes
+
+    def _register_model_size(self, queue_id: str) -> None:
+        try:
+            model_dir = getattr(self[queue_id], "cache_dir", None)
+        except Exception:
+            return
+        model_size = estimate_model_size(model_dir=model_dir)
+        if model_size > 0:
+            self._model_sizes[queue_id] = model_size
+
+    def _mark_model_usage(self, model_id: str) -> None:
+        new_count = self._access_counts.get(model_id, 0) + 1
+        if new_count >= COUNTER_SATURATION_THRESHOLD:
+            # keep relative utilization order while preventing unbounded growth
+            for key in self._access_counts:
+                self._access_counts[key] //= 2
+            new_count = self._access_counts.get(model_id, 0) + 1
+        self._access_counts[model_id] = new_count
+        self._last_access[model_id] = time.monotonic()
+
     def _resolve_queue_id(
         self, model_id: str, model_id_alias: Optional[str] = None
     ) -> str:
@@ -8,5 +8,12 @@ class LockedLoadModelManagerDecorator(ModelManagerDecorator):
     """Must acquire lock to load model"""
 
     def add_model(self, model_id: str, api_key: str, model_id_alias=None):
+        if model_id in self:
+            # the lock only guards the actual load - skip the cache round-trip
+            # when the model is already resident
+            return
         with cache.lock(lock_str(model_id), expire=180.0):
+            if model_id in self:
+                # another caller loaded the model while we awaited the lock
+                return
             return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
@@ -29,12 +29,19 @@ def get_model_metrics(
               - num_errors (int): The number of errors occurred.
     """
     now = time.time()
-    inferences_with_times = cache.zrangebyscore(
-        f"inference:{inference_server_id}:{model_id}", min=min, max=max, withscores=True
+    # both sorted sets are fetched in one cache round trip; scores are not
+    # needed here, so WITHSCORES encoding overhead is skipped as well
+    inferences, errors = cache.zrangebyscore_many(
+        [
+            f"inference:{inference_server_id}:{model_id}",
+            f"error:{inference_server_id}:{model_id}",
+        ],
+        min=min,
+        max=max,
     )
-    num_inferences = len(inferences_with_times)
+    num_inferences = len(inferences)
     inference_times = []
-    for inference, t in inferences_with_times:
+    for inference in inferences:
         response = inference["response"]
         if isinstance(response, list):
             times = [r["time"] for r in response if "time" in r]
@@ -45,10 +52,7 @@ def get_model_metrics(
     avg_inference_time = (
         sum(inference_times) / len(inference_times) if len(inference_times) > 0 else 0
     )
-    errors_with_times = cache.zrangebyscore(
-        f"error:{inference_server_id}:{model_id}", min=min, max=max, withscores=True
-    )
-    num_errors = len(errors_with_times)
+    num_errors = len(errors)
     return {
         "num_inferences": num_inferences,
         "avg_inference_time": avg_inference_time,
@@ -85,6 +89,29 @@ def get_inference_results_for_model(
     inferences_with_times = cache.zrangebyscore(
         f"inference:{inference_server_id}:{model_id}", min=min, max=max, withscores=True
     )
+    return _format_inference_results(inferences_with_times)
+
+
+def get_inference_results_for_models(
+    inference_server_id: str,
+    model_ids: list,
+    min: float = -1,
+    max: float = float("inf"),
+):
+    """Fetches inference results for all given models in a single cache round trip."""
+    results_per_model = cache.zrangebyscore_many(
+        [f"inference:{inference_server_id}:{model_id}" for model_id in model_ids],
+        min=min,
+        max=max,
+        withscores=True,
+    )
+    inference_results = []
+    for inferences_with_times in results_per_model:
+        inference_results.extend(_format_inference_results(inferences_with_times))
+    return inference_results
+
+
+def _format_inference_results(inferences_with_times: list) -> list:
     inference_results = []
     for result, score in inferences_with_times:
         # Don't send large image files
@@ -1,8 +1,8 @@
+import threading
 import time
 import traceback
 
 import requests
-from apscheduler.schedulers.background import BackgroundScheduler
 
 from inference.core.devices.utils import GLOBAL_DEVICE_ID, GLOBAL_INFERENCE_SERVER_ID
 from inference.core.env import (
@@ -14,7 +14,7 @@ from inference.core.env import (
 )
 from inference.core.logger import logger
 from inference.core.managers.metrics import (
-    get_inference_results_for_model,
+    get_inference_results_for_models,
     get_system_info,
 )
 from inference.core.utils.requests import api_key_safe_raise_for_status
@@ -25,11 +25,10 @@ from inference.core.version import __version__
 class PingbackInfo:
     """Class responsible for managing pingback information for Roboflow.
 
-    This class initializes a scheduler to periodically post data to Roboflow, containing information about the models,
-    container, and device.
+    This class initializes a reporting thread to periodically post data to Roboflow, containing information about
+    the models, container, and device.
 
     Attributes:
-        scheduler (BackgroundScheduler): A scheduler for running jobs in the background.
         model_manager (ModelManager): Reference to the model manager object.
         process_startup_time (str): Unix timestamp indicating when the process started.
         METRICS_URL (str): URL to send the pingback data to.
@@ -44,9 +43,8 @@ class PingbackInfo:
             manager (ModelManager): Reference to the model manager object.
         """
         try:
-            self.scheduler = BackgroundScheduler(
-                job_defaults={"coalesce": True, "max_instances": 1}
-            )
+            self._stop_event = threading.Event()
+            self._reporting_thread = None
             self.model_manager = manager
             self.process_startup_time = str(int(time.time()))
             logger.debug(
@@ -74,9 +72,9 @@ class PingbackInfo:
             )
 
     def start(self):
-        """Starts the scheduler to periodically post data to Roboflow.
+        """Starts the reporting thread periodically posting data to Roboflow.
 
-        If METRICS_ENABLED is False, a warning is logged, and the method returns without starting the scheduler.
+        If METRICS_ENABLED is False, a warning is logged, and the method returns without starting the thread.
         """
         if METRICS_ENABLED == False:
             logger.warning(
@@ -84,20 +82,31 @@ class PingbackInfo:
             )
             return
         try:
-            self.scheduler.add_job(
-                self.post_data,
-                "interval",
-                seconds=METRICS_INTERVAL,
-                args=[self.model_manager],
-                replace_existing=True,
+            if self._reporting_thread is not None:
+                return
+            # a plain daemon thread with an interruptible sleep replaces the
+            # APScheduler thread pool - a single interval job does not need a
+            # scheduler (and single-threaded execution gives coalescing and
+            # max_instances=1 for free)
+            self._stop_event.clear()
+            self._reporting_thread = threading.Thread(
+                target=self._report_on_interval, daemon=True
             )
-            self.scheduler.start()
+            self._reporting_thread.start()
         except Exception as e:
             logger.debug(e)
 
     def stop(self):
-        """Stops the scheduler."""
-        self.scheduler.shutdown()
+        """Stops the reporting thread."""
+        self._stop_event.set()
+        self._reporting_thread = None
+
+    def _report_on_interval(self):
+        while not self._stop_event.wait(timeout=METRICS_INTERVAL):
+            try:
+                self.post_data(self.model_manager)
+            except Exception as e:
+                logger.debug(e)
 
     def post_data(self, model_manager):
         """Posts data to Roboflow about the models, container, device, and other relevant metrics.
@@ -117,11 +126,13 @@ class PingbackInfo:
         try:
             now = time.time()
             start = now - METRICS_INTERVAL
-            for model_id in model_manager.models():
-                results = get_inference_results_for_model(
-                    GLOBAL_INFERENCE_SERVER_ID, model_id, min=start, max=now
-                )
-                all_data["inference_results"] = all_data["inference_results"] + results
+            # results for all models are pulled in one cache round trip
+            all_data["inference_results"] = get_inference_results_for_models(
+                GLOBAL_INFERENCE_SERVER_ID,
+                list(model_manager.models()),
+                min=start,
+                max=now,
+            )
             res = requests.post(wrap_url(METRICS_URL), json=all_data, timeout=10)
             try:
                 api_key_safe_raise_for_status(response=res)
@@ -20,10 +20,15 @@ class InferenceInstrumentator:
     """
 
     def __init__(self, app, model_manager, endpoint: str = "/metrics"):
+        if getattr(app.state, "inference_instrumented", False):
+            # registration is process-global - instrumenting the same app
+            # twice would duplicate middlewares, routes and collectors
+            return
         self.instrumentator = Instrumentator()
         self.instrumentator.instrument(app).expose(app, endpoint)
         self.collector = CustomCollector(model_manager)
         REGISTRY.register(self.collector)
+        app.state.inference_instrumented = True
 
 
 class CustomCollector(Collector):
@@ -336,7 +336,7 @@ class RoboflowInferenceModel(Model):
             raise ModelArtefactError(
                 "Could not find `PREPROCESSING` key in environment file."
             )
-        if issubclass(type(self.environment["PREPROCESSING"]), dict):
+        if isinstance(self.environment["PREPROCESSING"], dict):
             self.preproc = self.environment["PREPROCESSING"]
         else:
             self.preproc = json.loads(self.environment["PREPROCESSING"])
@@ -870,7 +870,7 @@ def color_mapping_available_in_environment(environment: Optional[dict]) -> bool:
     return (
         environment is not None
         and "COLORS" in environment
-        and issubclass(type(environment["COLORS"]), dict)
+        and isinstance(environment["COLORS"], dict)
     )
 
 
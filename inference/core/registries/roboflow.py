@@ -181,7 +181,7 @@ def model_metadata_content_is_invalid(content: Optional[Union[list, dict]]) -> b
     if content is None:
         logger.warning("Empty model metadata file encountered in cache.")
         return True
-    if not issubclass(type(content), dict):
+    if not isinstance(content, dict):
         logger.warning("Malformed file encountered in cache.")
         return True
     if PROJECT_TASK_TYPE_KEY not in content or MODEL_TYPE_KEY not in content:
@@ -38,7 +38,7 @@ def str2bool(value: Any) -> bool:
     """
     if isinstance(value, bool):
         return value
-    if not issubclass(type(value), str):
+    if not isinstance(value, str):
         raise InvalidEnvironmentVariableError(
             f"Expected a boolean environment variable (true or false) but got '{value}'"
         )
@@ -131,10 +131,10 @@ def extract_image_payload_and_type(value: Any) -> Tuple[Any, Optional[ImageType]
         Tuple[Any, Optional[ImageType]]: A tuple containing the extracted image data and the corresponding image type.
     """
     image_type = None
-    if issubclass(type(value), InferenceRequestImage):
+    if isinstance(value, InferenceRequestImage):
         image_type = value.type
         value = value.value
-    elif issubclass(type(value), dict):
+    elif isinstance(value, dict):
         image_type = value.get("type")
         value = value.get("value")
     allowed_payload_types = {e.value for e in ImageType}
@@ -350,7 +350,7 @@ def validate_numpy_image(data: np.ndarray) -> None:
     Raises:
         InvalidNumpyInput: If the provided data is not a valid numpy image.
     """
-    if not issubclass(type(data), np.ndarray):
+    if not isinstance(data, np.ndarray):
         raise InvalidNumpyInput(
             message=f"Data provided as input could not be decoded into np.ndarray object.",
             public_message=f"Data provided as input could not be decoded into np.ndarray object.",
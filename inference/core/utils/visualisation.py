@@ -63,7 +63,9 @@ def draw_detection_predictions(
                 box=box,
                 color=color,
             )
-    image_bgr = image[:, :, ::-1]
+    # cv2.cvtColor() materialises a contiguous array - the negative-stride view
+    # produced by [:, :, ::-1] forces the JPEG encoder onto a strided-copy path
+    image_bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
     return encode_image_to_jpeg_bytes(image=image_bgr)
 
 
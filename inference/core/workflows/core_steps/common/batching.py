@@ -0,0 +1,106 @@
+import threading
+from typing import Callable, Dict, Hashable, List, TypeVar
+
+from inference.core.env import (
+    WORKFLOWS_STEP_BATCHING_MAX_BATCH_SIZE,
+    WORKFLOWS_STEP_BATCHING_MAX_WAIT_MS,
+)
+
+PayloadType = TypeVar("PayloadType")
+ResultType = TypeVar("ResultType")
+
+
+class _PendingItem:
+
+    __slots__ = ("payload", "result", "error", "done")
+
+    def __init__(self, payload: PayloadType):
+        self.payload = payload
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class AdaptiveBatcher:
+    """Coalesces payloads submitted by concurrent callers into micro-batches.
+
+    Callers block in `submit(...)` until their payload is processed. Payloads
+    accumulated while a batch is in flight (or within the optional wait window)
+    are handed to `batch_handler` as a single list, so concurrent workflow
+    invocations hitting the same model share one dispatch instead of queueing
+    independently. With the wait window disabled (the default), a lone caller
+    is processed immediately - batching only emerges under concurrent load.
+
+    Batches are formed continuously at request granularity: while one batch is
+    being processed, newly submitted payloads accumulate and the next waiting
+    caller drains them as soon as the handler frees up, so work admitted
+    mid-flight does not wait for an epoch boundary. Interleaving at token
+    granularity (prefill/decode continuous batching) would require a stepwise
+    generate API, which the local transformer backends do not expose.
+    """
+
+    def __init__(
+        self,
+        batch_handler: Callable[[List[PayloadType]], List[ResultType]],
+        max_batch_size: int = WORKFLOWS_STEP_BATCHING_MAX_BATCH_SIZE,
+        max_wait_ms: float = WORKFLOWS_STEP_BATCHING_MAX_WAIT_MS,
+    ):
+        self._batch_handler = batch_handler
+        self._max_batch_size = max(max_batch_size, 1)
+        self._max_wait_s = max(max_wait_ms, 0.0) / 1000
+        self._pending: List[_PendingItem] = []
+        self._queue_lock = threading.Lock()
+        self._processing_lock = threading.Lock()
+
+    def submit(self, payload: PayloadType) -> ResultType:
+        item = _PendingItem(payload=payload)
+        with self._queue_lock:
+            self._pending.append(item)
+        if self._max_wait_s > 0:
+            item.done.wait(timeout=self._max_wait_s)
+        while not item.done.is_set():
+            with self._processing_lock:
+                if item.done.is_set():
+                    break
+                with self._queue_lock:
+                    batch = self._pending[: self._max_batch_size]
+                    del self._pending[: len(batch)]
+                if batch:
+                    self._process_batch(batch=batch)
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def _process_batch(self, batch: List[_PendingItem]) -> None:
+        try:
+            results = self._batch_handler([item.payload for item in batch])
+            for item, result in zip(batch, results):
+                item.result = result
+        except Exception as error:
+            for item in batch:
+                item.error = error
+        finally:
+            for item in batch:
+                item.done.set()
+
+
+_BATCHERS: Dict[Hashable, AdaptiveBatcher] = {}
+_BATCHERS_LOCK = threading.Lock()
+
+
+def get_batcher(
+    key: Hashable,
+    batch_handler: Callable[[List[PayloadType]], List[ResultType]],
+) -> AdaptiveBatcher:
+    """Returns process-wide `AdaptiveBatcher` shared by all callers using `key`.
+
+    `batch_handler` is only used when the batcher for `key` is first created,
+    so any state the handler closes over must be part of `key` - callers
+    dispatching through a `ModelManager` should key on
+    `(id(model_manager), model_id)` so that requests coalesce per model, but
+    never leak into a batcher bound to another manager instance.
+    """
+    with _BATCHERS_LOCK:
+        if key not in _BATCHERS:
+            _BATCHERS[key] = AdaptiveBatcher(batch_handler=batch_handler)
+        return _BATCHERS[key]
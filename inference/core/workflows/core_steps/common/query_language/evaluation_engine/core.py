@@ -75,11 +75,24 @@ def build_eval_function(
                 statement, execution_context=statement_execution_context
             )
         )
+    # statements list and combining operator are fixed at build time - validating
+    # and resolving them here keeps the per-evaluation path free of lookups
+    if not statements_functions:
+        raise EvaluationEngineError(
+            public_message=f"Attempted to execute evaluation of statements in context of {execution_context}, "
+            f"but empty statements list provided.",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+        )
+    if definition.operator not in COMPOUND_EVAL_STATEMENTS_COMBINERS:
+        raise EvaluationEngineError(
+            public_message=f"Attempted to execute evaluation of statements in context of {execution_context} "
+            f"using operator: {definition.operator} which is not registered.",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+        )
     return partial(
         compound_eval,
         statements_functions=statements_functions,
-        operator=definition.operator,
-        execution_context=execution_context,
+        operator_fun=COMPOUND_EVAL_STATEMENTS_COMBINERS[definition.operator],
     )
 
 
@@ -134,6 +147,10 @@ def create_static_operand_builder(
         build_operations_chain,
     )
 
+    if not definition.operations:
+        # no operations to apply - the operand is a plain constant
+        static_value = definition.value
+        return lambda values: static_value
     operations_fun = build_operations_chain(
         operations=definition.operations,
         execution_context=f"{execution_context}.operations",
@@ -162,6 +179,12 @@ def create_dynamic_operand_builder(
         build_operations_chain,
     )
 
+    if not definition.operations:
+        # no operations to apply - collapse the builder into a direct lookup
+        return partial(
+            dynamic_operand_fetcher,
+            operand_name=definition.operand_name,
+        )
     operations_fun = build_operations_chain(
         operations=definition.operations,
         execution_context=f"{execution_context}.operations",
@@ -186,6 +209,15 @@ def dynamic_operand_builder(
     return operations_function(values[operand_name], global_parameters=values)
 
 
+def dynamic_operand_fetcher(values: Dict[str, T], operand_name: str) -> V:
+    if operand_name not in values:
+        raise UndeclaredSymbolError(
+            public_message=f"Encountered undefined symbol `{operand_name}`",
+            context="unknown",
+        )
+    return values[operand_name]
+
+
 def binary_eval(
     values: Dict[str, T],
     left_operand_builder: Callable[[Dict[str, T]], V],
@@ -289,22 +321,8 @@ COMPOUND_EVAL_STATEMENTS_COMBINERS = {
 def compound_eval(
     values: Dict[str, T],
     statements_functions: List[Callable[[Dict[str, T]], bool]],
-    operator: StatementsGroupsOperator,
-    execution_context: str,
+    operator_fun: Callable[[bool, bool], bool],
 ) -> bool:
-    if not statements_functions:
-        raise EvaluationEngineError(
-            public_message=f"Attempted to execute evaluation of statements in context of {execution_context}, "
-            f"but empty statements list provided.",
-            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
-        )
-    if operator not in COMPOUND_EVAL_STATEMENTS_COMBINERS:
-        raise EvaluationEngineError(
-            public_message=f"Attempted to execute evaluation of statements in context of {execution_context} "
-            f"using operator: {operator} which is not registered.",
-            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
-        )
-    operator_fun = COMPOUND_EVAL_STATEMENTS_COMBINERS[operator]
     result = statements_functions[0](values)
     for fun in statements_functions[1:]:
         fun_result = fun(values)
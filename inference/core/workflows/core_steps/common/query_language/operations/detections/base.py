@@ -86,7 +86,7 @@ def offset_detections(
             f"got {value_as_str} of type {type(value)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
-    detections_copy = deepcopy(value)
+    detections_copy = copy_detections_for_coordinates_change(detections=value)
     detections_copy.xyxy += [-offset_x / 2, -offset_y / 2, offset_x / 2, offset_y / 2]
     return detections_copy
 
@@ -99,11 +99,26 @@ def shift_detections(value: Any, shift_x: int, shift_y: int, **kwargs) -> sv.Det
             f"got {value_as_str} of type {type(value)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
-    detections_copy = deepcopy(value)
+    detections_copy = copy_detections_for_coordinates_change(detections=value)
     detections_copy.xyxy += [shift_x, shift_y, shift_x, shift_y]
     return detections_copy
 
 
+def copy_detections_for_coordinates_change(
+    detections: sv.Detections,
+) -> sv.Detections:
+    # cheaper than deepcopy - only xyxy is mutated by callers, so masks,
+    # confidences and data arrays can be shared with the source object
+    return sv.Detections(
+        xyxy=detections.xyxy.copy(),
+        mask=detections.mask,
+        confidence=detections.confidence,
+        class_id=detections.class_id,
+        tracker_id=detections.tracker_id,
+        data=copy(detections.data),
+    )
+
+
 def select_top_confidence_detection(detections: sv.Detections) -> sv.Detections:
     if len(detections) == 0:
         return deepcopy(detections)
@@ -146,12 +146,14 @@ def serialise_image(image: WorkflowImageData) -> Dict[str, Any]:
     return {
         "type": "base64",
         "value": image.base64_image,
-        "video_metadata": image.video_metadata.dict(),
+        "video_metadata": image.video_metadata.model_dump(),
     }
 
 
 def serialize_video_metadata_kind(video_metadata: VideoMetadata) -> dict:
-    return video_metadata.dict()
+    # model_dump goes straight to pydantic v2 serialisation instead of the
+    # deprecated .dict() compatibility shim - this runs once per frame
+    return video_metadata.model_dump()
 
 
 def serialize_wildcard_kind(value: Any) -> Any:
@@ -1,3 +1,5 @@
+import hashlib
+import itertools
 import logging
 import uuid
 from concurrent.futures import ThreadPoolExecutor
@@ -49,6 +51,19 @@ from inference.core.workflows.execution_engine.entities.base import (
 
 T = TypeVar("T")
 
+_DETECTION_ID_PROCESS_TAG = uuid.uuid4().hex[:8]
+_detection_id_counter = itertools.count()
+
+
+def generate_detection_id() -> str:
+    """Generates identifier unique within a process.
+
+    Detection ids only need uniqueness within a run - a process-level random
+    tag plus an atomic counter is much cheaper than a fresh uuid4() (which
+    reads from the entropy pool) per detection.
+    """
+    return f"{_DETECTION_ID_PROCESS_TAG}-{next(_detection_id_counter)}"
+
 
 def load_core_model(
     model_manager: ModelManager,
@@ -85,7 +100,7 @@ def attach_prediction_type_info_to_sv_detections_batch(
     key: str = PREDICTION_TYPE_KEY,
 ) -> List[sv.Detections]:
     for prediction in predictions:
-        prediction[key] = np.array([prediction_type] * len(prediction))
+        prediction[key] = np.full(len(prediction), prediction_type)
     return predictions
 
 
@@ -104,11 +119,11 @@ def convert_inference_detections_batch_to_sv_detections(
         ]
         detections[DETECTION_ID_KEY] = np.array(detection_ids)
         detections[PARENT_ID_KEY] = np.array(parent_ids)
-        detections[IMAGE_DIMENSIONS_KEY] = np.array([[height, width]] * len(detections))
+        detections[IMAGE_DIMENSIONS_KEY] = np.broadcast_to(
+            np.array([height, width]), (len(detections), 2)
+        ).copy()
         if INFERENCE_ID_KEY in p:
-            detections[INFERENCE_ID_KEY] = np.array(
-                [p[INFERENCE_ID_KEY]] * len(detections)
-            )
+            detections[INFERENCE_ID_KEY] = np.full(len(detections), p[INFERENCE_ID_KEY])
         batch_of_detections.append(detections)
     return batch_of_detections
 
@@ -205,21 +220,23 @@ def attach_parent_coordinates_to_detections(
     dimensions_key: str,
 ) -> sv.Detections:
     parent_coordinates_system = parent_metadata.origin_coordinates
-    detections[parent_id_key] = np.array([parent_metadata.parent_id] * len(detections))
-    coordinates = np.array(
-        [[parent_coordinates_system.left_top_x, parent_coordinates_system.left_top_y]]
-        * len(detections)
-    )
+    detections[parent_id_key] = np.full(len(detections), parent_metadata.parent_id)
+    coordinates = np.broadcast_to(
+        np.array(
+            [parent_coordinates_system.left_top_x, parent_coordinates_system.left_top_y]
+        ),
+        (len(detections), 2),
+    ).copy()
     detections[coordinates_key] = coordinates
-    dimensions = np.array(
-        [
+    dimensions = np.broadcast_to(
+        np.array(
             [
                 parent_coordinates_system.origin_height,
                 parent_coordinates_system.origin_width,
             ]
-        ]
-        * len(detections)
-    )
+        ),
+        (len(detections), 2),
+    ).copy()
     detections[dimensions_key] = dimensions
     return detections
 
@@ -253,17 +270,15 @@ def sv_detections_to_root_coordinates(
             detections=detections,
             scale=1 / scale,
         )
-    detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.array(
-        [1.0] * len(detections_copy)
-    )
-    detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array(
-        [1.0] * len(detections_copy)
+    detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.full(len(detections_copy), 1.0)
+    detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.full(
+        len(detections_copy), 1.0
     )
     origin_height = detections_copy[ROOT_PARENT_DIMENSIONS_KEY][0][0]
     origin_width = detections_copy[ROOT_PARENT_DIMENSIONS_KEY][0][1]
-    detections_copy[IMAGE_DIMENSIONS_KEY] = np.array(
-        [[origin_height, origin_width]] * len(detections_copy)
-    )
+    detections_copy[IMAGE_DIMENSIONS_KEY] = np.broadcast_to(
+        np.array([origin_height, origin_width]), (len(detections_copy), 2)
+    ).copy()
     root_parent_id = detections_copy[ROOT_PARENT_ID_KEY][0]
     shift_x, shift_y = detections_copy[ROOT_PARENT_COORDINATES_KEY][0]
     detections_copy.xyxy += [shift_x, shift_y, shift_x, shift_y]
@@ -317,10 +332,11 @@ def filter_out_unwanted_classes_from_sv_detections_batch(
 ) -> List[sv.Detections]:
     if not classes_to_accept:
         return predictions
+    classes_to_accept_array = np.asarray(classes_to_accept)
     filtered_predictions = []
     for prediction in predictions:
         filtered_prediction = prediction[
-            np.isin(prediction[CLASS_NAME_DATA_FIELD], classes_to_accept)
+            np.isin(prediction[CLASS_NAME_DATA_FIELD], classes_to_accept_array)
         ]
         filtered_predictions.append(filtered_prediction)
     return filtered_predictions
@@ -389,16 +405,16 @@ def scale_sv_detections(
             detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] * scale
         )
     else:
-        detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.array(
-            [scale] * len(detections_copy)
+        detections_copy[SCALING_RELATIVE_TO_PARENT_KEY] = np.full(
+            len(detections_copy), scale
         )
     if SCALING_RELATIVE_TO_ROOT_PARENT_KEY in detections_copy.data:
         detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = (
             detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] * scale
         )
     else:
-        detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array(
-            [scale] * len(detections_copy)
+        detections_copy[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.full(
+            len(detections_copy), scale
         )
     return detections_copy
 
@@ -414,6 +430,12 @@ def remove_unexpected_keys_from_dictionary(
     return dictionary
 
 
+def image_content_hash(image: np.ndarray) -> str:
+    """Stable digest of raw image content - used to deduplicate identical
+    images within a batch before dispatching them to a model."""
+    return hashlib.sha256(image.tobytes()).hexdigest()
+
+
 def run_in_parallel(tasks: List[Callable[[], T]], max_workers: int = 1) -> List[T]:
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         return list(executor.map(_run, tasks))
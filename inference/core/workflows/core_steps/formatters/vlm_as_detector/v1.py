@@ -289,6 +289,11 @@ def scale_confidence(value: float) -> float:
     return min(max(float(value), 0.0), 1.0)
 
 
+# task-specialised extractor resolved once - from_lmm dispatches on the
+# LMM kind per call, which is constant here
+_florence2_detections_extractor = partial(sv.Detections.from_lmm, "florence_2")
+
+
 def parse_florence2_object_detection_response(
     image: WorkflowImageData,
     parsed_data: dict,
@@ -297,8 +302,7 @@ def parse_florence2_object_detection_response(
     florence_task_type: str,
 ):
     image_height, image_width = image.numpy_image.shape[:2]
-    detections = sv.Detections.from_lmm(
-        "florence_2",
+    detections = _florence2_detections_extractor(
         result={florence_task_type: parsed_data},
         resolution_wh=(image_width, image_height),
     )
@@ -0,0 +1,52 @@
+"""IoU kernel used by the detections consensus matching loop.
+
+The kernel compares one candidate box against a whole source of boxes. When
+`numba` is installed, a JIT-compiled loop version is used - written loop-style
+(not numpy-style) so that LLVM can vectorise the arithmetic. Otherwise the
+NumPy implementation below is used; both return identical results, with
+degenerate (zero-union) pairs reported as IoU 0.0.
+"""
+
+import numpy as np
+
+
+def iou_one_to_many_numpy(
+    box: np.ndarray,
+    boxes: np.ndarray,
+    box_area: float,
+    boxes_areas: np.ndarray,
+) -> np.ndarray:
+    x_min = np.maximum(box[0], boxes[:, 0])
+    y_min = np.maximum(box[1], boxes[:, 1])
+    x_max = np.minimum(box[2], boxes[:, 2])
+    y_max = np.minimum(box[3], boxes[:, 3])
+    intersection = np.clip(x_max - x_min, 0, None) * np.clip(y_max - y_min, 0, None)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou_values = intersection / (box_area + boxes_areas - intersection)
+    return np.nan_to_num(iou_values, nan=0.0)
+
+
+try:
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def iou_one_to_many(
+        box: np.ndarray,
+        boxes: np.ndarray,
+        box_area: float,
+        boxes_areas: np.ndarray,
+    ) -> np.ndarray:
+        iou_values = np.zeros(boxes.shape[0], dtype=np.float64)
+        for i in range(boxes.shape[0]):
+            x_min = max(box[0], boxes[i, 0])
+            y_min = max(box[1], boxes[i, 1])
+            x_max = min(box[2], boxes[i, 2])
+            y_max = min(box[3], boxes[i, 3])
+            intersection = max(x_max - x_min, 0.0) * max(y_max - y_min, 0.0)
+            union = box_area + boxes_areas[i] - intersection
+            if union > 0:
+                iou_values[i] = intersection / union
+        return iou_values
+
+except ImportError:
+    iou_one_to_many = iou_one_to_many_numpy
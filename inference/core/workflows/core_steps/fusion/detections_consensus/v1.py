@@ -1,14 +1,26 @@
 import math
-import statistics
-from collections import Counter
 from enum import Enum
-from typing import Dict, Generator, List, Literal, Optional, Set, Tuple, Type, Union
-from uuid import uuid4
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
 import supervision as sv
 from pydantic import AliasChoices, ConfigDict, Field, PositiveInt
 
+from inference.core.workflows.core_steps.common.utils import generate_detection_id
+from inference.core.workflows.core_steps.fusion.detections_consensus.iou_matching import (
+    iou_one_to_many,
+)
 from inference.core.workflows.execution_engine.constants import (
     DETECTION_ID_KEY,
     IMAGE_DIMENSIONS_KEY,
@@ -258,8 +270,11 @@ def filter_predictions(
 ) -> List[sv.Detections]:
     if not classes_to_consider:
         return predictions
+    # conversion of the class list into ndarray is hoisted out of the loop,
+    # so np.isin() does not repeat it for every source
+    classes_to_consider_array = np.asarray(classes_to_consider)
     return [
-        detections[np.isin(detections["class_name"], classes_to_consider)]
+        detections[np.isin(detections["class_name"], classes_to_consider_array)]
         for detections in predictions
         if "class_name" in detections.data
     ]
@@ -272,29 +287,66 @@ def get_detections_from_different_sources_with_max_overlap(
     iou_threshold: float,
     class_aware: bool,
     detections_already_considered: Set[str],
+    sources_boxes_areas: Optional[List[np.ndarray]] = None,
+    sources_detection_ids: Optional[List[List[str]]] = None,
 ) -> Dict[int, Tuple[sv.Detections, float]]:
     current_max_overlap = {}
-    for other_source, other_detection in enumerate_detections(
-        detections_from_sources=detections_from_sources,
-        excluded_source_id=source,
-    ):
-        if other_detection[DETECTION_ID_KEY][0] in detections_already_considered:
+    detection_box = detection.xyxy[0]
+    detection_box_area = float(
+        (detection_box[2] - detection_box[0]) * (detection_box[3] - detection_box[1])
+    )
+    for other_source, other_detections in enumerate(detections_from_sources):
+        if other_source == source or len(other_detections) == 0:
             continue
-        if (
-            class_aware
-            and detection["class_name"][0] != other_detection["class_name"][0]
-        ):
+        # cheap class and already-considered filters run first, so sources
+        # without any viable candidate skip the IoU computation entirely
+        candidates_mask = np.ones(len(other_detections), dtype=bool)
+        if class_aware:
+            # data["class_name"] may be a plain list - comparing list == str
+            # yields a scalar False instead of an element-wise mask
+            candidates_mask &= (
+                np.asarray(other_detections["class_name"]) == detection["class_name"][0]
+            )
+        if detections_already_considered:
+            # pre-extracted python string lists keep membership tests free of
+            # numpy scalar boxing and re-hashing on every candidate pair
+            other_detection_ids = (
+                sources_detection_ids[other_source]
+                if sources_detection_ids is not None
+                else other_detections[DETECTION_ID_KEY]
+            )
+            candidates_mask &= np.fromiter(
+                (
+                    detection_id not in detections_already_considered
+                    for detection_id in other_detection_ids
+                ),
+                dtype=bool,
+                count=len(other_detections),
+            )
+        if not candidates_mask.any():
             continue
-        iou_value = calculate_iou(
-            detection_a=detection,
-            detection_b=other_detection,
+        # IoU of the candidate box against the whole source is computed in one
+        # vectorised pass instead of slicing out single-element detections
+        iou_values = calculate_iou_one_to_many(
+            box=detection_box,
+            boxes=other_detections.xyxy,
+            box_area=detection_box_area,
+            boxes_areas=(
+                sources_boxes_areas[other_source]
+                if sources_boxes_areas is not None
+                else None
+            ),
         )
-        if iou_value <= iou_threshold:
+        candidates_mask &= iou_values > iou_threshold
+        if not candidates_mask.any():
             continue
-        if current_max_overlap.get(other_source) is None:
-            current_max_overlap[other_source] = (other_detection, iou_value)
-        if current_max_overlap[other_source][1] < iou_value:
-            current_max_overlap[other_source] = (other_detection, iou_value)
+        # np.argmax() returns the first maximum, preserving the original
+        # first-encountered tie-breaking
+        best_match = int(np.argmax(np.where(candidates_mask, iou_values, -1.0)))
+        current_max_overlap[other_source] = (
+            other_detections[best_match],
+            float(iou_values[best_match]),
+        )
     return current_max_overlap
 
 
@@ -310,10 +362,34 @@ def enumerate_detections(
 
 
 def calculate_iou(detection_a: sv.Detections, detection_b: sv.Detections) -> float:
-    iou = float(sv.box_iou_batch(detection_a.xyxy, detection_b.xyxy)[0][0])
-    if math.isnan(iou):
-        iou = 0
-    return iou
+    return float(
+        calculate_iou_one_to_many(
+            box=detection_a.xyxy[0],
+            boxes=detection_b.xyxy,
+        )[0]
+    )
+
+
+def calculate_iou_one_to_many(
+    box: np.ndarray,
+    boxes: np.ndarray,
+    box_area: Optional[float] = None,
+    boxes_areas: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    if box_area is None:
+        box_area = calculate_boxes_areas(boxes=box[np.newaxis, :])[0]
+    if boxes_areas is None:
+        boxes_areas = calculate_boxes_areas(boxes=boxes)
+    return iou_one_to_many(
+        np.asarray(box, dtype=np.float64),
+        np.asarray(boxes, dtype=np.float64),
+        float(box_area),
+        np.asarray(boxes_areas, dtype=np.float64),
+    )
+
+
+def calculate_boxes_areas(boxes: np.ndarray) -> np.ndarray:
+    return (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
 
 
 def agree_on_consensus_for_all_detections_sources(
@@ -339,6 +415,41 @@ def agree_on_consensus_for_all_detections_sources(
         predictions=detections_from_sources,
         classes_to_consider=classes_to_consider,
     )
+    # when every detection sits below the confidence threshold, no merge can
+    # pass the post-merge confidence gate (min, max and average of all-below
+    # values stay below) - the quadratic matching can be skipped entirely
+    if confidence > 0 and all(
+        len(detections) == 0
+        or (
+            detections.confidence is not None
+            and float(detections.confidence.max()) < confidence
+        )
+        for detections in detections_from_sources
+    ):
+        return parent_id, False, {}, sv.Detections.empty()
+    # areas are batch-invariant - computing them once here avoids re-deriving
+    # them for every candidate pair inside the matching loop
+    sources_boxes_areas = [
+        calculate_boxes_areas(boxes=detections.xyxy)
+        for detections in detections_from_sources
+    ]
+    # ids extracted into plain python lists once, so membership tests in the
+    # matching loop do not repeatedly box numpy string scalars
+    sources_detection_ids = [
+        detections[DETECTION_ID_KEY].tolist() if len(detections) else []
+        for detections in detections_from_sources
+    ]
+    # aggregation modes are constant for the whole step run - resolving the
+    # dispatch tables once avoids repeating the lookups for every merge
+    class_selector = AGGREGATION_MODE2CLASS_SELECTOR[
+        detections_merge_confidence_aggregation
+    ]
+    boxes_aggregator = AGGREGATION_MODE2BOXES_AGGREGATOR[
+        detections_merge_coordinates_aggregation
+    ]
+    confidence_aggregator = AGGREGATION_MODE2FIELD_AGGREGATOR[
+        detections_merge_confidence_aggregation
+    ]
     detections_already_considered = set()
     consensus_detections = []
     for source_id, detection in enumerate_detections(
@@ -358,6 +469,11 @@ def agree_on_consensus_for_all_detections_sources(
             detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
             detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
             detections_already_considered=detections_already_considered,
+            sources_boxes_areas=sources_boxes_areas,
+            sources_detection_ids=sources_detection_ids,
+            class_selector=class_selector,
+            boxes_aggregator=boxes_aggregator,
+            confidence_aggregator=confidence_aggregator,
         )
         consensus_detections += consensus_detections_update
     consensus_detections = sv.Detections.merge(consensus_detections)
@@ -389,6 +505,13 @@ def get_consensus_for_single_detection(
     detections_merge_confidence_aggregation: AggregationMode,
     detections_merge_coordinates_aggregation: AggregationMode,
     detections_already_considered: Set[str],
+    sources_boxes_areas: Optional[List[np.ndarray]] = None,
+    sources_detection_ids: Optional[List[List[str]]] = None,
+    class_selector: Optional[Callable[[sv.Detections], Tuple[str, int]]] = None,
+    boxes_aggregator: Optional[
+        Callable[[sv.Detections], Tuple[int, int, int, int]]
+    ] = None,
+    confidence_aggregator: Optional[Callable[[List[float]], float]] = None,
 ) -> Tuple[List[sv.Detections], Set[str]]:
     if detection and detection["detection_id"][0] in detections_already_considered:
         return [], detections_already_considered
@@ -401,6 +524,8 @@ def get_consensus_for_single_detection(
             iou_threshold=iou_threshold,
             class_aware=class_aware,
             detections_already_considered=detections_already_considered,
+            sources_boxes_areas=sources_boxes_areas,
+            sources_detection_ids=sources_detection_ids,
         )
     )
 
@@ -415,6 +540,9 @@ def get_consensus_for_single_detection(
         detections=detections_to_merge,
         confidence_aggregation_mode=detections_merge_confidence_aggregation,
         boxes_aggregation_mode=detections_merge_coordinates_aggregation,
+        class_selector=class_selector,
+        boxes_aggregator=boxes_aggregator,
+        confidence_aggregator=confidence_aggregator,
     )
     if merged_detection.confidence[0] < confidence:
         # Returning empty sv.Detections
@@ -450,25 +578,23 @@ def check_objects_presence_in_consensus_detections(
             aggregation_mode=aggregation_mode,
         )
         return True, {"any_object": aggregated_confidence}
-    class2detections = {}
-    for class_name in set(consensus_detections["class_name"]):
-        class2detections[class_name] = consensus_detections[
-            consensus_detections["class_name"] == class_name
-        ]
+    # grouping and confidence collection happen in a single pass, instead of
+    # slicing the detections once per class with boolean masks
+    class2confidences: Dict[str, List[float]] = {}
+    for class_name, class_confidence in zip(
+        consensus_detections["class_name"], consensus_detections.confidence
+    ):
+        class2confidences.setdefault(str(class_name), []).append(
+            float(class_confidence)
+        )
     if isinstance(required_objects, dict):
         for requested_class, required_objects_count in required_objects.items():
-            if (
-                requested_class not in class2detections
-                or len(class2detections[requested_class]) < required_objects_count
-            ):
+            if len(class2confidences.get(requested_class, [])) < required_objects_count:
                 return False, {}
+    aggregator = AGGREGATION_MODE2FIELD_AGGREGATOR[aggregation_mode]
     class2confidence = {
-        class_name: aggregate_field_values(
-            detections=class_detections,
-            field="confidence",
-            aggregation_mode=aggregation_mode,
-        )
-        for class_name, class_detections in class2detections.items()
+        class_name: aggregator(class_confidences)
+        for class_name, class_confidences in class2confidences.items()
     }
     return True, class2confidence
 
@@ -477,17 +603,22 @@ def merge_detections(
     detections: sv.Detections,
     confidence_aggregation_mode: AggregationMode,
     boxes_aggregation_mode: AggregationMode,
+    class_selector: Optional[Callable[[sv.Detections], Tuple[str, int]]] = None,
+    boxes_aggregator: Optional[
+        Callable[[sv.Detections], Tuple[int, int, int, int]]
+    ] = None,
+    confidence_aggregator: Optional[Callable[[List[float]], float]] = None,
 ) -> sv.Detections:
-    class_name, class_id = AGGREGATION_MODE2CLASS_SELECTOR[confidence_aggregation_mode](
-        detections
-    )
-    x1, y1, x2, y2 = AGGREGATION_MODE2BOXES_AGGREGATOR[boxes_aggregation_mode](
-        detections
-    )
+    if class_selector is None:
+        class_selector = AGGREGATION_MODE2CLASS_SELECTOR[confidence_aggregation_mode]
+    if boxes_aggregator is None:
+        boxes_aggregator = AGGREGATION_MODE2BOXES_AGGREGATOR[boxes_aggregation_mode]
+    class_name, class_id = class_selector(detections)
+    x1, y1, x2, y2 = boxes_aggregator(detections)
     data = {
         "class_name": np.array([class_name]),
         PARENT_ID_KEY: np.array([detections[PARENT_ID_KEY][0]]),
-        DETECTION_ID_KEY: np.array([str(uuid4())]),
+        DETECTION_ID_KEY: np.array([generate_detection_id()]),
         PREDICTION_TYPE_KEY: np.array(["object-detection"]),
         PARENT_COORDINATES_KEY: np.array([detections[PARENT_COORDINATES_KEY][0]]),
         PARENT_DIMENSIONS_KEY: np.array([detections[PARENT_DIMENSIONS_KEY][0]]),
@@ -521,6 +652,7 @@ def merge_detections(
                     detections=detections,
                     field="confidence",
                     aggregation_mode=confidence_aggregation_mode,
+                    aggregator=confidence_aggregator,
                 )
             ],
             dtype=np.float64,
@@ -530,36 +662,29 @@ def merge_detections(
 
 
 def get_majority_class(detections: sv.Detections) -> Tuple[str, int]:
-    class_counts = Counter(
-        [
-            (str(class_name), int(class_id))
-            for class_name, class_id in zip(
-                detections["class_name"], detections.class_id
-            )
-        ]
-    )
-    return class_counts.most_common(1)[0][0]
+    class_counts: Dict[Tuple[str, int], int] = {}
+    for class_name, class_id in zip(detections["class_name"], detections.class_id):
+        key = (str(class_name), int(class_id))
+        class_counts[key] = class_counts.get(key, 0) + 1
+    # max() yields the first-inserted key on ties, matching Counter.most_common
+    return max(class_counts, key=class_counts.get)
 
 
 def get_class_of_most_confident_detection(detections: sv.Detections) -> Tuple[str, int]:
-    confidences: List[float] = detections.confidence.astype(float).tolist()
-    max_confidence_index = confidences.index(max(confidences))
-    max_confidence_detection = detections[max_confidence_index]
+    max_confidence_index = int(np.argmax(detections.confidence))
     return (
-        max_confidence_detection["class_name"][0],
-        max_confidence_detection.class_id[0],
+        detections["class_name"][max_confidence_index],
+        detections.class_id[max_confidence_index],
     )
 
 
 def get_class_of_least_confident_detection(
     detections: sv.Detections,
 ) -> Tuple[str, int]:
-    confidences: List[float] = detections.confidence.astype(float).tolist()
-    min_confidence_index = confidences.index(min(confidences))
-    min_confidence_detection = detections[min_confidence_index]
+    min_confidence_index = int(np.argmin(detections.confidence))
     return (
-        min_confidence_detection["class_name"][0],
-        min_confidence_detection.class_id[0],
+        detections["class_name"][min_confidence_index],
+        detections.class_id[min_confidence_index],
     )
 
 
@@ -576,17 +701,13 @@ def get_average_bounding_box(detections: sv.Detections) -> Tuple[int, int, int,
 
 
 def get_smallest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
-    areas: List[float] = detections.area.astype(float).tolist()
-    min_area = min(areas)
-    min_area_index = areas.index(min_area)
-    return tuple(detections[min_area_index].xyxy[0])
+    min_area_index = int(np.argmin(detections.area))
+    return tuple(detections.xyxy[min_area_index])
 
 
 def get_largest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
-    areas: List[float] = detections.area.astype(float).tolist()
-    max_area = max(areas)
-    max_area_index = areas.index(max_area)
-    return tuple(detections[max_area_index].xyxy[0])
+    max_area_index = int(np.argmax(detections.area))
+    return tuple(detections.xyxy[max_area_index])
 
 
 AGGREGATION_MODE2BOXES_AGGREGATOR = {
@@ -595,10 +716,23 @@ AGGREGATION_MODE2BOXES_AGGREGATOR = {
     AggregationMode.AVERAGE: get_average_bounding_box,
 }
 
+
+def average_field_values(values: List[float]) -> float:
+    # math.fsum keeps statistics.mean precision without its per-call type
+    # introspection overhead; for longer lists a single vectorised mean
+    # beats accumulating element by element
+    if not values:
+        # match the StatisticsError (a ValueError) raised by statistics.mean
+        raise ValueError("cannot average empty collection of values")
+    if len(values) < 16:
+        return math.fsum(values) / len(values)
+    return float(np.fromiter(values, dtype=np.float64, count=len(values)).mean())
+
+
 AGGREGATION_MODE2FIELD_AGGREGATOR = {
     AggregationMode.MAX: max,
     AggregationMode.MIN: min,
-    AggregationMode.AVERAGE: statistics.mean,
+    AggregationMode.AVERAGE: average_field_values,
 }
 
 
@@ -606,7 +740,10 @@ def aggregate_field_values(
     detections: sv.Detections,
     field: str,
     aggregation_mode: AggregationMode = AggregationMode.AVERAGE,
+    aggregator: Optional[Callable[[List[float]], float]] = None,
 ) -> float:
+    if aggregator is None:
+        aggregator = AGGREGATION_MODE2FIELD_AGGREGATOR[aggregation_mode]
     values = []
     if hasattr(detections, field):
         values = getattr(detections, field)
@@ -616,4 +753,4 @@ def aggregate_field_values(
         values = detections[field]
         if isinstance(values, np.ndarray):
             values = values.astype(float).tolist()
-    return AGGREGATION_MODE2FIELD_AGGREGATOR[aggregation_mode](values)
+    return aggregator(values)
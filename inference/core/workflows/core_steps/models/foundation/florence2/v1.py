@@ -1,13 +1,22 @@
+import hashlib
 import json
-from typing import List, Literal, Optional, Type, TypeVar, Union
+from functools import lru_cache, partial
+from typing import List, Literal, Optional, Tuple, Type, TypeVar, Union
+from uuid import uuid4
 
 import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field, model_validator
 
 from inference.core.entities.requests.inference import LMMInferenceRequest
+from inference.core.env import WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS
 from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.batching import get_batcher
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.common.utils import (
+    image_content_hash,
+    run_in_parallel,
+)
 from inference.core.workflows.core_steps.common.vlms import VLM_TASKS_METADATA
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -370,16 +379,18 @@ class Florence2BlockV1(WorkflowBlock):
         ],
         grounding_selection_mode: GroundingSelectionMode,
     ) -> BlockResult:
+        if not images:
+            return []
         requires_detection_grounding = task_type in TASKS_REQUIRING_DETECTION_GROUNDING
 
         is_not_florence_task = task_type == "custom"
         task_type = TASK_TYPE_TO_FLORENCE_TASK[task_type]
-        inference_images = [
-            i.to_inference_format(numpy_preferred=False) for i in images
-        ]
+        # model runs in-process - hand over ndarrays directly instead of
+        # paying base64 encode here and decode in the model
+        inference_images = [i.to_inference_format(numpy_preferred=True) for i in images]
         prompts = [prompt] * len(images)
         if classes is not None:
-            prompts = ["<and>".join(classes)] * len(images)
+            prompts = [_build_classes_prompt(classes=tuple(classes))] * len(images)
         else:
             classes = []
         if grounding_detection is not None:
@@ -392,47 +403,136 @@ class Florence2BlockV1(WorkflowBlock):
             model_id=model_version,
             api_key=self._api_key,
         )
-        predictions = []
+        # single pass building requests and deduplicating identical
+        # (image, prompt) pairs, which are inferred once and scattered back
+        requests = []
+        request_template = None
+        unique_requests, slot_by_content, result_indices = [], {}, []
         for image, single_prompt in zip(inference_images, prompts):
             if single_prompt is None and requires_detection_grounding:
                 # no grounding bbox found - empty result returned
-                predictions.append(
-                    {"raw_output": None, "parsed_output": None, "classes": None}
-                )
+                requests.append(None)
                 continue
             if is_not_florence_task:
                 prompt = single_prompt or ""
             else:
-                prompt = task_type + (single_prompt or "")
-
-            request = LMMInferenceRequest(
-                api_key=self._api_key,
-                model_id=model_version,
-                image=image,
-                source="workflow-execution",
-                prompt=prompt,
-            )
-            prediction = self._model_manager.infer_from_request_sync(
-                model_id=model_version, request=request
-            )
-            if is_not_florence_task:
-                prediction_data = prediction.response[
-                    list(prediction.response.keys())[0]
-                ]
+                prompt = _prefix_prompt_with_task(
+                    task_type=task_type, prompt=single_prompt
+                )
+            if request_template is None:
+                request = request_template = LMMInferenceRequest(
+                    api_key=self._api_key,
+                    model_id=model_version,
+                    image=image,
+                    source="workflow-execution",
+                    prompt=prompt,
+                )
             else:
-                prediction_data = prediction.response[task_type]
-            if task_type in TASKS_TO_EXTRACT_LABELS_AS_CLASSES:
-                classes = prediction_data.get("labels", [])
+                # constant fields were validated once - copy the template
+                # instead of paying pydantic validation per image
+                request = request_template.model_copy(
+                    update={"id": str(uuid4()), "image": image, "prompt": prompt}
+                )
+            requests.append(request)
+            content_key = (_request_image_hash(request=request), prompt)
+            if content_key not in slot_by_content:
+                slot_by_content[content_key] = len(unique_requests)
+                unique_requests.append(request)
+            result_indices.append(slot_by_content[content_key])
+        batcher = get_batcher(
+            key=(id(self._model_manager), model_version),
+            batch_handler=partial(
+                _execute_florence_requests,
+                model_manager=self._model_manager,
+                model_id=model_version,
+            ),
+        )
+        unique_results = batcher.submit(unique_requests)
+        inference_results = [unique_results[index] for index in result_indices]
+        return _build_florence_predictions(
+            requests=requests,
+            inference_results=inference_results,
+            task_type=task_type,
+            is_not_florence_task=is_not_florence_task,
+            classes=classes,
+        )
+
+
+@lru_cache(maxsize=1024)
+def _build_classes_prompt(classes: Tuple[str, ...]) -> str:
+    return "<and>".join(classes)
+
+
+@lru_cache(maxsize=1024)
+def _prefix_prompt_with_task(task_type: str, prompt: Optional[str]) -> str:
+    return task_type + (prompt or "")
+
+
+def _request_image_hash(request: LMMInferenceRequest) -> str:
+    image = request.image
+    value = image.get("value") if isinstance(image, dict) else image.value
+    if isinstance(value, np.ndarray):
+        return image_content_hash(value)
+    return hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+
+
+def _build_florence_predictions(
+    requests: List[Optional[LMMInferenceRequest]],
+    inference_results: List[dict],
+    task_type: Optional[str],
+    is_not_florence_task: bool,
+    classes: List[str],
+) -> List[dict]:
+    results_iterator = iter(inference_results)
+    predictions = []
+    for request in requests:
+        if request is None:
             predictions.append(
-                {
-                    "raw_output": json.dumps(prediction_data),
-                    "parsed_output": (
-                        prediction_data if isinstance(prediction_data, dict) else None
-                    ),
-                    "classes": classes,
-                }
+                {"raw_output": None, "parsed_output": None, "classes": None}
             )
-        return predictions
+            continue
+        prediction = next(results_iterator)
+        if is_not_florence_task:
+            prediction_data = prediction.response[list(prediction.response.keys())[0]]
+        else:
+            prediction_data = prediction.response[task_type]
+        if task_type in TASKS_TO_EXTRACT_LABELS_AS_CLASSES:
+            classes = prediction_data.get("labels", [])
+        predictions.append(
+            {
+                "raw_output": json.dumps(prediction_data),
+                "parsed_output": (
+                    prediction_data if isinstance(prediction_data, dict) else None
+                ),
+                "classes": classes,
+            }
+        )
+    return predictions
+
+
+def _execute_florence_requests(
+    request_groups: List[List[LMMInferenceRequest]],
+    model_manager: ModelManager,
+    model_id: str,
+) -> List[List[dict]]:
+    flattened_requests = [request for group in request_groups for request in group]
+    tasks = [
+        partial(
+            model_manager.infer_from_request_sync,
+            model_id=model_id,
+            request=request,
+        )
+        for request in flattened_requests
+    ]
+    results = run_in_parallel(
+        tasks=tasks,
+        max_workers=WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
+    )
+    regrouped_results, start = [], 0
+    for group in request_groups:
+        regrouped_results.append(results[start : start + len(group)])
+        start += len(group)
+    return regrouped_results
 
 
 def prepare_detection_grounding_prompts(
@@ -14,7 +14,11 @@ from inference.core.env import (
     WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
 )
 from inference.core.managers.base import ModelManager
-from inference.core.utils.image_utils import encode_image_to_jpeg_bytes, load_image
+from inference.core.utils.image_utils import (
+    BASE64_DATA_TYPE_PATTERN,
+    encode_image_to_jpeg_bytes,
+    load_image,
+)
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import (
     load_core_model,
@@ -359,9 +363,16 @@ def execute_gpt_4v_request(
 ) -> Dict[str, str]:
     loaded_image, _ = load_image(image)
     image_metadata = {"width": loaded_image.shape[1], "height": loaded_image.shape[0]}
-    base64_image = base64.b64encode(encode_image_to_jpeg_bytes(loaded_image)).decode(
-        "ascii"
-    )
+    if image["type"] == "base64" and isinstance(image["value"], str):
+        # payload already holds an encoded image - reuse it instead of
+        # re-encoding the decoded frame back to JPEG (skipping auto-orient,
+        # as the image goes out verbatim anyway); user-supplied payloads may
+        # carry a data-url prefix which must not be doubled below
+        base64_image = BASE64_DATA_TYPE_PATTERN.sub("", image["value"])
+    else:
+        base64_image = base64.b64encode(
+            encode_image_to_jpeg_bytes(loaded_image)
+        ).decode("ascii")
     response = client.chat.completions.create(
         model=lmm_config.gpt_model_version,
         messages=[
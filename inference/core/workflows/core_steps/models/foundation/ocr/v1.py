@@ -1,3 +1,4 @@
+from functools import partial
 from typing import List, Literal, Optional, Type
 
 from pydantic import ConfigDict, Field
@@ -11,10 +12,13 @@ from inference.core.env import (
     WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.batching import get_batcher
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.utils import (
+    image_content_hash,
     load_core_model,
     remove_unexpected_keys_from_dictionary,
+    run_in_parallel,
 )
 from inference.core.workflows.execution_engine.constants import (
     PARENT_ID_KEY,
@@ -129,21 +133,38 @@ class OCRModelBlockV1(WorkflowBlock):
         self,
         images: Batch[WorkflowImageData],
     ) -> BlockResult:
-        predictions = []
+        if not images:
+            return []
+        # identical images (e.g. the same crop flowing through multiple
+        # branches) are inferred once and results scattered back
+        unique_payloads, slot_by_content, result_indices = [], {}, []
         for single_image in images:
-            inference_request = DoctrOCRInferenceRequest(
-                image=single_image.to_inference_format(numpy_preferred=True),
-                api_key=self._api_key,
-            )
-            doctr_model_id = load_core_model(
+            content_key = image_content_hash(single_image.numpy_image)
+            if content_key not in slot_by_content:
+                slot_by_content[content_key] = len(unique_payloads)
+                unique_payloads.append(
+                    single_image.to_inference_format(numpy_preferred=True)
+                )
+            result_indices.append(slot_by_content[content_key])
+        inference_request = DoctrOCRInferenceRequest(
+            image=unique_payloads,
+            api_key=self._api_key,
+        )
+        doctr_model_id = load_core_model(
+            model_manager=self._model_manager,
+            inference_request=inference_request,
+            core_model="doctr",
+        )
+        batcher = get_batcher(
+            key=(id(self._model_manager), doctr_model_id),
+            batch_handler=partial(
+                _execute_doctr_requests,
                 model_manager=self._model_manager,
-                inference_request=inference_request,
-                core_model="doctr",
-            )
-            result = self._model_manager.infer_from_request_sync(
-                doctr_model_id, inference_request
-            )
-            predictions.append(result.model_dump())
+                model_id=doctr_model_id,
+            ),
+        )
+        unique_predictions = batcher.submit(inference_request)
+        predictions = [unique_predictions[index].copy() for index in result_indices]
         return self._post_process_result(
             predictions=predictions,
             images=images,
@@ -196,3 +217,25 @@ class OCRModelBlockV1(WorkflowBlock):
                 expected_keys=EXPECTED_OUTPUT_KEYS,
             )
         return predictions
+
+
+def _execute_doctr_requests(
+    requests: List[DoctrOCRInferenceRequest],
+    model_manager: ModelManager,
+    model_id: str,
+) -> List[List[dict]]:
+    # torch releases the GIL during the forward pass, so requests coalesced
+    # from different callers can proceed concurrently
+    batch_of_responses = run_in_parallel(
+        tasks=[
+            partial(model_manager.infer_from_request_sync, model_id, request)
+            for request in requests
+        ],
+        max_workers=WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_CONCURRENT_REQUESTS,
+    )
+    results = []
+    for responses in batch_of_responses:
+        if not isinstance(responses, list):
+            responses = [responses]
+        results.append([response.model_dump() for response in responses])
+    return results
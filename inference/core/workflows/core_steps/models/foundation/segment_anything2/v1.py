@@ -277,8 +277,7 @@ def convert_sam2_segmentation_response_to_inference_instances_seg_response(
     prompt_detection_ids: List[Optional[str]],
     threshold: float,
 ) -> InstanceSegmentationInferenceResponse:
-    image_width = image.numpy_image.shape[1]
-    image_height = image.numpy_image.shape[0]
+    image_height, image_width = image.numpy_image.shape[:2]
     predictions = []
     if len(prompt_class_ids) == 0:
         prompt_class_ids = [0 for _ in range(len(sam2_segmentation_predictions))]
@@ -1,8 +1,11 @@
+import os
+from functools import partial
 from typing import List, Literal, Optional, Type, Union
 from uuid import uuid4
 
 from pydantic import ConfigDict, Field, PositiveInt
 
+from inference.core.workflows.core_steps.common.utils import run_in_parallel
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
     OutputDefinition,
@@ -89,18 +92,28 @@ class AbsoluteStaticCropBlockV1(WorkflowBlock):
         width: int,
         height: int,
     ) -> BlockResult:
-        return [
-            {
-                "crops": take_static_crop(
-                    image=image,
-                    x_center=x_center,
-                    y_center=y_center,
-                    width=width,
-                    height=height,
-                )
-            }
+        # lazy images are decoded on first pixels access inside the crop -
+        # for multi-image batches decoding happens in worker threads, as
+        # OpenCV releases the GIL
+        tasks = [
+            partial(
+                take_static_crop,
+                image=image,
+                x_center=x_center,
+                y_center=y_center,
+                width=width,
+                height=height,
+            )
             for image in images
         ]
+        if len(tasks) > 1:
+            crops = run_in_parallel(
+                tasks=tasks,
+                max_workers=min(8, os.cpu_count() or 1),
+            )
+        else:
+            crops = [task() for task in tasks]
+        return [{"crops": crop} for crop in crops]
 
 
 def take_static_crop(
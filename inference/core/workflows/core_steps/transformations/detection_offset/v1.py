@@ -1,11 +1,11 @@
-import uuid
-from copy import deepcopy
+from copy import copy
 from typing import List, Literal, Optional, Type, Union
 
 import numpy as np
 import supervision as sv
 from pydantic import AliasChoices, ConfigDict, Field, PositiveInt
 
+from inference.core.workflows.core_steps.common.utils import generate_detection_id
 from inference.core.workflows.execution_engine.constants import (
     DETECTION_ID_KEY,
     PARENT_ID_KEY,
@@ -128,19 +128,30 @@ def offset_detections(
 ) -> sv.Detections:
     if len(detections) == 0:
         return detections
-    _detections = deepcopy(detections)
-    image_dimensions = detections.data["image_dimensions"]
-    _detections.xyxy = np.array(
+    # deepcopy would duplicate masks and every data array, while only xyxy
+    # and two data keys are replaced below - share the rest
+    _detections = sv.Detections(
+        xyxy=detections.xyxy,
+        mask=detections.mask,
+        confidence=detections.confidence,
+        class_id=detections.class_id,
+        tracker_id=detections.tracker_id,
+        data=copy(detections.data),
+    )
+    image_dimensions = np.asarray(detections.data["image_dimensions"])
+    half_width = offset_width // 2
+    half_height = offset_height // 2
+    # all boxes are offset and clamped in one vectorized pass instead of
+    # re-building coordinate tuples per detection
+    _detections.xyxy = np.stack(
         [
-            (
-                max(0, x1 - offset_width // 2),
-                max(0, y1 - offset_height // 2),
-                min(image_dimensions[i][1], x2 + offset_width // 2),
-                min(image_dimensions[i][0], y2 + offset_height // 2),
-            )
-            for i, (x1, y1, x2, y2) in enumerate(_detections.xyxy)
-        ]
+            np.clip(detections.xyxy[:, 0] - half_width, 0, None),
+            np.clip(detections.xyxy[:, 1] - half_height, 0, None),
+            np.minimum(detections.xyxy[:, 2] + half_width, image_dimensions[:, 1]),
+            np.minimum(detections.xyxy[:, 3] + half_height, image_dimensions[:, 0]),
+        ],
+        axis=1,
     )
     _detections[parent_id_key] = detections[detection_id_key].copy()
-    _detections[detection_id_key] = [str(uuid.uuid4()) for _ in detections]
+    _detections[detection_id_key] = [generate_detection_id() for _ in detections]
     return _detections
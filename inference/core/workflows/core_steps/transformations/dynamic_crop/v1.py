@@ -163,11 +163,19 @@ def crop_image(
             f"sv.Detections object passed to crop step do not fulfill contract - lack of {detection_id_key} key "
             f"in data dictionary."
         )
+    numpy_image = image.numpy_image
+    image_height, image_width = numpy_image.shape[:2]
+    # all crop coordinates are rounded and clamped in one vectorized pass -
+    # clipping also protects the slicing below from negative coordinates,
+    # which would silently wrap around the image
+    xyxy = detections.xyxy.round().astype(dtype=int)
+    xyxy[:, [0, 2]] = np.clip(xyxy[:, [0, 2]], 0, image_width)
+    xyxy[:, [1, 3]] = np.clip(xyxy[:, [1, 3]], 0, image_height)
     crops = []
     for idx, ((x_min, y_min, x_max, y_max), detection_id) in enumerate(
-        zip(detections.xyxy.round().astype(dtype=int), detections[detection_id_key])
+        zip(xyxy, detections[detection_id_key])
     ):
-        cropped_image = image.numpy_image[y_min:y_max, x_min:x_max]
+        cropped_image = numpy_image[y_min:y_max, x_min:x_max]
         if not cropped_image.size:
             crops.append({"crops": None})
             continue
@@ -1,8 +1,11 @@
+import os
+from functools import partial
 from typing import List, Literal, Optional, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from inference.core.workflows.core_steps.common.utils import run_in_parallel
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
     OutputDefinition,
@@ -90,18 +93,28 @@ class RelativeStaticCropBlockV1(WorkflowBlock):
         width: float,
         height: float,
     ) -> BlockResult:
-        return [
-            {
-                "crops": take_static_crop(
-                    image=image,
-                    x_center=x_center,
-                    y_center=y_center,
-                    width=width,
-                    height=height,
-                )
-            }
+        # lazy images are decoded on first pixels access inside the crop -
+        # for multi-image batches decoding happens in worker threads, as
+        # OpenCV releases the GIL
+        tasks = [
+            partial(
+                take_static_crop,
+                image=image,
+                x_center=x_center,
+                y_center=y_center,
+                width=width,
+                height=height,
+            )
             for image in images
         ]
+        if len(tasks) > 1:
+            crops = run_in_parallel(
+                tasks=tasks,
+                max_workers=min(8, os.cpu_count() or 1),
+            )
+        else:
+            crops = [task() for task in tasks]
+        return [{"crops": crop} for crop in crops]
 
 
 def take_static_crop(
@@ -111,15 +124,17 @@ def take_static_crop(
     width: float,
     height: float,
 ) -> Optional[WorkflowImageData]:
-    x_center = round(image.numpy_image.shape[1] * x_center)
-    y_center = round(image.numpy_image.shape[0] * y_center)
-    width = round(image.numpy_image.shape[1] * width)
-    height = round(image.numpy_image.shape[0] * height)
+    numpy_image = image.numpy_image
+    image_height, image_width = numpy_image.shape[:2]
+    x_center = round(image_width * x_center)
+    y_center = round(image_height * y_center)
+    width = round(image_width * width)
+    height = round(image_height * height)
     x_min = round(x_center - width / 2)
     y_min = round(y_center - height / 2)
     x_max = round(x_min + width)
     y_max = round(y_min + height)
-    cropped_image = image.numpy_image[y_min:y_max, x_min:x_max]
+    cropped_image = numpy_image[y_min:y_max, x_min:x_max]
     if not cropped_image.size:
         return None
     return WorkflowImageData.create_crop(
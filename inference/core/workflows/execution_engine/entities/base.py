@@ -1,5 +1,5 @@
 import base64
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
@@ -312,13 +312,14 @@ class WorkflowImageData:
         Creates new instance of `WorkflowImageData` being a crop of original image,
         making adjustment to all metadata.
         """
+        origin_height, origin_width = origin_image_data.numpy_image.shape[:2]
         parent_metadata = ImageParentMetadata(
             parent_id=crop_identifier,
             origin_coordinates=OriginCoordinatesSystem(
                 left_top_x=offset_x,
                 left_top_y=offset_y,
-                origin_width=origin_image_data.numpy_image.shape[1],
-                origin_height=origin_image_data.numpy_image.shape[0],
+                origin_width=origin_width,
+                origin_height=origin_height,
             ),
         )
         workflow_root_ancestor_coordinates = replace(
@@ -345,6 +346,33 @@ class WorkflowImageData:
             video_metadata=video_metadata,
         )
 
+    def __copy__(self) -> "WorkflowImageData":
+        return WorkflowImageData(
+            parent_metadata=self._parent_metadata,
+            workflow_root_ancestor_metadata=self._workflow_root_ancestor_metadata,
+            image_reference=self._image_reference,
+            base64_image=self._base64_image,
+            numpy_image=self._numpy_image,
+            video_metadata=self._video_metadata,
+        )
+
+    def __deepcopy__(self, memo: dict) -> "WorkflowImageData":
+        # pixel buffers are treated as immutable across the pipeline, so deep
+        # copies share them - crops remain views over the origin image instead
+        # of being duplicated whenever a step copies its input
+        copied = WorkflowImageData(
+            parent_metadata=deepcopy(self._parent_metadata, memo),
+            workflow_root_ancestor_metadata=deepcopy(
+                self._workflow_root_ancestor_metadata, memo
+            ),
+            image_reference=self._image_reference,
+            base64_image=self._base64_image,
+            numpy_image=self._numpy_image,
+            video_metadata=deepcopy(self._video_metadata, memo),
+        )
+        memo[id(self)] = copied
+        return copied
+
     @property
     def parent_metadata(self) -> ImageParentMetadata:
         if self._parent_metadata.origin_coordinates is None:
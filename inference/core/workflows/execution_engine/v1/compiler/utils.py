@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Set, Type, TypeVar
 
 from networkx import DiGraph
@@ -23,6 +24,7 @@ def get_input_parameters_selectors(inputs: List[InputType]) -> Set[str]:
     }
 
 
+@lru_cache(maxsize=1024)
 def construct_input_selector(input_name: str) -> str:
     return f"$inputs.{input_name}"
 
@@ -31,6 +33,9 @@ def get_steps_selectors(steps: List[WorkflowBlockManifest]) -> Set[str]:
     return {construct_step_selector(step_name=step.name) for step in steps}
 
 
+# selectors are derived from immutable names over and over on the hot path -
+# memoization avoids repeated f-string allocation
+@lru_cache(maxsize=1024)
 def construct_step_selector(step_name: str) -> str:
     return f"$steps.{step_name}"
 
@@ -39,6 +44,7 @@ def get_output_selectors(outputs: List[JsonField]) -> Set[str]:
     return {construct_output_selector(name=output.name) for output in outputs}
 
 
+@lru_cache(maxsize=1024)
 def construct_output_selector(name: str) -> str:
     return f"$outputs.{name}"
 
@@ -67,6 +73,7 @@ def is_step_output_selector(selector_or_value: Any) -> bool:
     )
 
 
+@lru_cache(maxsize=1024)
 def get_step_selector_from_its_output(step_output_selector: str) -> str:
     return ".".join(step_output_selector.split(".")[:2])
 
@@ -81,6 +88,7 @@ def get_nodes_of_specific_category(
     }
 
 
+@lru_cache(maxsize=1024)
 def get_last_chunk_of_selector(selector: str) -> str:
     return selector.split(".")[-1]
 
@@ -666,39 +666,39 @@ def get_batch_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
 def iterate_over_batches(
     batch_parameters: Dict[str, Any]
 ) -> Generator[Dict[str, Any], None, None]:
-    index = 0
-    end = False
-    while not end:
+    # the layout of each parameter is iteration-invariant - batch slots inside
+    # compound values and the common iteration length are discovered once, so
+    # each yielded element only fills batch values for the given index
+    compound_parameters_plan = {}
+    batches_lengths = []
+    for name, value in batch_parameters.items():
+        if isinstance(value, Batch):
+            batches_lengths.append(len(value))
+        elif isinstance(value, list):
+            batch_slots = [
+                (position, element)
+                for position, element in enumerate(value)
+                if isinstance(element, Batch)
+            ]
+            batches_lengths.extend(len(element) for _, element in batch_slots)
+            compound_parameters_plan[name] = (list(value), batch_slots)
+        elif isinstance(value, dict):
+            batch_slots = [
+                (key, key_value)
+                for key, key_value in value.items()
+                if isinstance(key_value, Batch)
+            ]
+            batches_lengths.extend(len(key_value) for _, key_value in batch_slots)
+            compound_parameters_plan[name] = (dict(value), batch_slots)
+    for index in range(min(batches_lengths, default=0)):
         result = {}
         for name, value in batch_parameters.items():
             if isinstance(value, Batch):
-                if len(value) <= index:
-                    end = True
-                    break
                 result[name] = value[index]
-            elif isinstance(value, list):
-                to_yield = []
-                for element in value:
-                    if isinstance(element, Batch):
-                        if len(element) <= index:
-                            end = True
-                            break
-                        to_yield.append(element[index])
-                    else:
-                        to_yield.append(element)
-                result[name] = to_yield
-            elif isinstance(value, dict):
-                to_yield = {}
-                for key, key_value in value.items():
-                    if not isinstance(key_value, Batch):
-                        to_yield[key] = key_value
-                    else:
-                        if len(key_value) <= index:
-                            end = True
-                            break
-                        else:
-                            to_yield[key] = key_value[index]
+            else:
+                template, batch_slots = compound_parameters_plan[name]
+                to_yield = template.copy()
+                for slot, batch in batch_slots:
+                    to_yield[slot] = batch[index]
                 result[name] = to_yield
-        index += 1
-        if not end:
-            yield result
+        yield result
@@ -70,9 +70,15 @@ class DocTR(RoboflowCoreModel):
 
     def infer_from_request(
         self, request: DoctrOCRInferenceRequest
-    ) -> OCRInferenceResponse:
+    ) -> Union[OCRInferenceResponse, List[OCRInferenceResponse]]:
         t1 = perf_counter()
         result = self.infer(**request.dict())
+        if isinstance(result, list):
+            inference_time = perf_counter() - t1
+            return [
+                OCRInferenceResponse(result=single_result, time=inference_time)
+                for single_result in result
+            ]
         return OCRInferenceResponse(
             result=result,
             time=perf_counter() - t1,
@@ -80,8 +86,10 @@ class DocTR(RoboflowCoreModel):
 
     def infer(self, image: Any, **kwargs):
         """
-        Run inference on a provided image.
-            - image: can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
+        Run inference on provided image(s).
+            - image: can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image,
+              byte-string, etc. or a list thereof - a list is processed as one
+              multi-page document in a single forward pass.
 
         Args:
             request (DoctrOCRInferenceRequest): The inference request.
@@ -89,29 +97,32 @@ class DocTR(RoboflowCoreModel):
         Returns:
             OCRInferenceResponse: The inference response.
         """
+        images = image if isinstance(image, list) else [image]
 
-        img = load_image(image)
-
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as f:
-            image = Image.fromarray(img[0])
-
-            image.save(f.name)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_paths = []
+            for index, single_image in enumerate(images):
+                img = load_image(single_image)
+                image_path = os.path.join(temp_dir, f"{index}.jpg")
+                Image.fromarray(img[0]).save(image_path)
+                image_paths.append(image_path)
 
-            doc = DocumentFile.from_images([f.name])
+            doc = DocumentFile.from_images(image_paths)
 
             result = self.model(doc).export()
 
-            result = result["pages"][0]["blocks"]
-
-            result = [
-                " ".join([word["value"] for word in line["words"]])
-                for block in result
-                for line in block["lines"]
+            results = [
+                " ".join(
+                    " ".join(word["value"] for word in line["words"])
+                    for block in page["blocks"]
+                    for line in block["lines"]
+                )
+                for page in result["pages"]
             ]
 
-            result = " ".join(result)
-
-            return result
+            if not isinstance(image, list):
+                return results[0]
+            return results
 
     def get_infer_bucket_file_list(self) -> list:
         """Get the list of required files for inference.
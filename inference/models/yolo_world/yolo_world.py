@@ -24,7 +24,7 @@ from inference.core.models.defaults import (
 from inference.core.models.roboflow import RoboflowCoreModel
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.hash import get_text_hash
-from inference.core.utils.image_utils import load_image_rgb
+from inference.core.utils.image_utils import load_image_bgr
 from inference.models import Clip
 
 EMBEDDINGS_EXPIRE_TIMEOUT = 1800  # 30 min
@@ -68,8 +68,9 @@ class YOLOWorld(RoboflowCoreModel):
         Returns:
             np.array: The preprocessed image.
         """
-        np_image = load_image_rgb(image)
-        return np_image[:, :, ::-1]
+        # load_image_bgr() yields a contiguous BGR array directly - reversing
+        # channels of an RGB load produced a negative-stride view
+        return load_image_bgr(image)
 
     def infer_from_request(
         self,
@@ -30,6 +30,12 @@ class PlanDetails(SQLiteWrapper):
         self._ts_col_name = "ts"
         self._ts_default = "1970-01-01 00:00:00 UTC"
         self._columns[self._ts_col_name] = "TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP"
+        # strptime is slow and the same timestamp string is re-parsed on every
+        # plan lookup between cache refreshes - memoize parsed values
+        self._parsed_ts_cache: Dict[str, datetime.datetime] = {}
+        self._ts_default_parsed = datetime.datetime.strptime(
+            self._ts_default, self._ts_format
+        ).replace(tzinfo=datetime.timezone.utc)
 
         self._api_key_hash_col_name = "api_key_hash"
         self._columns[self._api_key_hash_col_name] = "TEXT NOT NULL"
@@ -211,15 +217,18 @@ class PlanDetails(SQLiteWrapper):
         cache_ts_str = self._ts_default
         if self._ts_col_name in api_key_plan:
             cache_ts_str = api_key_plan[self._ts_col_name]
-        try:
-            cache_ts = datetime.datetime.strptime(
-                cache_ts_str, self._ts_format
-            ).replace(tzinfo=datetime.timezone.utc)
-        except Exception as exc:
-            logger.debug("Failed to parse api key plan cache timestamp - %s", exc)
-            cache_ts = datetime.datetime.strptime(
-                self._ts_default, self._ts_format
-            ).replace(tzinfo=datetime.timezone.utc)
+        cache_ts = self._parsed_ts_cache.get(cache_ts_str)
+        if cache_ts is None:
+            try:
+                cache_ts = datetime.datetime.strptime(
+                    cache_ts_str, self._ts_format
+                ).replace(tzinfo=datetime.timezone.utc)
+            except Exception as exc:
+                logger.debug("Failed to parse api key plan cache timestamp - %s", exc)
+                cache_ts = self._ts_default_parsed
+            if len(self._parsed_ts_cache) > 1024:
+                self._parsed_ts_cache.clear()
+            self._parsed_ts_cache[cache_ts_str] = cache_ts
 
         cache_age = date_time_now - cache_ts
         if cache_age.seconds + cache_age.days * 86400 > self._cache_ttl_seconds:
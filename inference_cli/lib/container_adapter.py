@@ -1,5 +1,6 @@
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 
 import typer
@@ -11,10 +12,24 @@ import docker
 from inference_cli.lib.exceptions import DockerConnectionErrorException
 from inference_cli.lib.utils import read_env_file
 
+INFERENCE_CONTAINER_LABEL = "roboflow.inference"
+
+_docker_client: Optional["docker.DockerClient"] = None
+
+
+def _get_docker_client() -> "docker.DockerClient":
+    # client creation negotiates API version over the docker socket - reuse
+    # a single client (and its connection pool) instead of re-connecting in
+    # every helper
+    global _docker_client
+    if _docker_client is None:
+        _docker_client = docker.from_env()
+    return _docker_client
+
 
 def ensure_docker_is_running() -> None:
     try:
-        _ = docker.from_env()
+        _ = _get_docker_client()
     except docker.errors.DockerException as e:
         raise DockerConnectionErrorException(
             "Error connecting to Docker daemon. Is docker installed and running? "
@@ -23,12 +38,13 @@ def ensure_docker_is_running() -> None:
 
 
 def ask_user_to_kill_container(container: Container) -> bool:
-    name = container.attrs.get("Name", "")
-    env_vars = container.attrs.get("Config", {}).get("Env", {})
+    attrs = container.attrs
+    name = attrs.get("Name", "")
+    env_vars = attrs.get("Config", {}).get("Env", {})
     port = 9001
     for var in env_vars:
         if var.startswith("PORT="):
-            port = var.split("=")[1]
+            port = var.partition("=")[2]
     should_delete = typer.confirm(
         f" An inference server is already running in container {name} on port {port}. Are you sure you want to delete it?"
     )
@@ -36,6 +52,13 @@ def ask_user_to_kill_container(container: Container) -> bool:
 
 
 def is_inference_server_container(container: Container) -> bool:
+    # image name from container attrs is available without extra docker API
+    # calls, whereas container.image triggers an image inspect round-trip
+    image_name = container.attrs.get("Config", {}).get("Image", "")
+    if isinstance(image_name, str) and image_name.startswith(
+        "roboflow/roboflow-inference-server"
+    ):
+        return True
     image_tags = container.image.tags
     for t in image_tags:
         if t.startswith("roboflow/roboflow-inference-server"):
@@ -71,17 +94,41 @@ def is_container_running(container: Container) -> str:
 
 
 def kill_containers(containers: List[Container]) -> None:
-    for container in containers:
-        container.kill()
+    if len(containers) <= 1:
+        for container in containers:
+            container.kill()
+        return
+    # each kill is a blocking docker API call - issue them concurrently so
+    # stopping many servers takes as long as the slowest one
+    with ThreadPoolExecutor(max_workers=min(8, len(containers))) as executor:
+        list(executor.map(lambda container: container.kill(), containers))
 
 
 def find_running_inference_containers() -> List[Container]:
-    docker_client = docker.from_env()
+    docker_client = _get_docker_client()
+    # containers started by this CLI carry a label the docker daemon can match
+    # without any image-name heuristics; the full listing is merged in so that
+    # unlabelled servers (started before the label existed, or by other means)
+    # are discovered alongside labelled ones
+    descriptions = docker_client.api.containers(
+        all=False, filters={"label": f"{INFERENCE_CONTAINER_LABEL}=1"}
+    )
+    labelled_ids = {description["Id"] for description in descriptions}
+    for description in docker_client.api.containers(all=False):
+        if description["Id"] not in labelled_ids:
+            descriptions.append(description)
     containers = []
-    for c in docker_client.containers.list():
-        if is_inference_server_container(c):
-            if c.attrs.get("State", {}).get("Status", "").lower() == "running":
-                containers.append(c)
+    for description in descriptions:
+        container = docker_client.containers.get(description["Id"])
+        # labelled containers are trusted outright; unlabelled ones go through
+        # the image-name check (attrs first, tags as a fallback, so containers
+        # referencing the image by digest are still recognised)
+        if description["Id"] not in labelled_ids and not is_inference_server_container(
+            container=container
+        ):
+            continue
+        if is_container_running(container=container):
+            containers.append(container)
     return containers
 
 
@@ -154,12 +201,19 @@ def start_inference_container(
         env_file_path=env_file_path,
         development=development,
     )
+    # label the container so future discovery can be filtered by the daemon
+    if labels is None:
+        labels = {}
+    if isinstance(labels, dict):
+        labels = {**labels, INFERENCE_CONTAINER_LABEL: "1"}
+    else:
+        labels = list(labels) + [f"{INFERENCE_CONTAINER_LABEL}=1"]
     pull_image(image, use_local_images=use_local_images)
     print(f"Starting inference server container...")
     ports = {"9001": port}
     if development:
         ports["9002"] = 9002
-    docker_client = docker.from_env()
+    docker_client = _get_docker_client()
     docker_client.containers.run(
         image=image,
         privileged=privileged,
@@ -211,11 +265,14 @@ def check_inference_server_status():
     containers = find_running_inference_containers()
     if len(containers) > 0:
         for c in containers:
-            container_name = c.attrs.get("Name", "")
-            created = c.attrs.get("Created", "")
-            exposed_port = list(c.attrs.get("Config").get("ExposedPorts", {}).keys())[0]
-            status = c.attrs.get("State", {}).get("Status", "unknown")
-            image = c.attrs.get("Image", "")
+            # each .attrs access walks docker-py's lazily populated container
+            # description - read it once per container
+            attrs = c.attrs
+            container_name = attrs.get("Name", "")
+            created = attrs.get("Created", "")
+            exposed_port = list(attrs.get("Config").get("ExposedPorts", {}).keys())[0]
+            status = attrs.get("State", {}).get("Status", "unknown")
+            image = attrs.get("Image", "")
             container_status_message = """
 Container Name: {container_name}
 Created: {created}
@@ -237,7 +294,7 @@ Image: {image}
 
 
 def pull_image(image: str, use_local_images: bool = False) -> None:
-    docker_client = docker.from_env()
+    docker_client = _get_docker_client()
     progress_tasks = {}
     try:
         _ = docker_client.images.get(image)
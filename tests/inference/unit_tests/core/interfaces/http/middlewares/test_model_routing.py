@@ -0,0 +1,152 @@
+import zlib
+from typing import List
+
+import pytest
+
+from inference.core.interfaces.http.middlewares.model_routing import (
+    ModelRoutingMiddleware,
+)
+
+REPLICAS = ["http://replica-0:9001", "http://replica-1:9001"]
+
+
+def replica_for(model_id: str) -> str:
+    return REPLICAS[zlib.crc32(model_id.encode("utf-8")) % len(REPLICAS)]
+
+
+def other_replica_than(replica: str) -> str:
+    return next(r for r in REPLICAS if r != replica)
+
+
+class EchoApp:
+    def __init__(self):
+        self.called = False
+        self.body = b""
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.called = True
+        message = await receive()
+        self.body = message.get("body", b"")
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+def make_receive(body: bytes):
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    return receive
+
+
+def make_send(sent: List[dict]):
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    return send
+
+
+@pytest.mark.asyncio
+async def test_non_post_requests_pass_through() -> None:
+    # given
+    app = EchoApp()
+    middleware = ModelRoutingMiddleware(app, replicas=REPLICAS, self_url=REPLICAS[0])
+    scope = {"type": "http", "method": "GET", "path": "/info"}
+
+    # when
+    await middleware(scope, make_receive(b""), make_send([]))
+
+    # then
+    assert app.called is True, "Non-POST requests must be handled locally"
+
+
+@pytest.mark.asyncio
+async def test_requests_pass_through_when_no_replicas_configured() -> None:
+    # given
+    app = EchoApp()
+    middleware = ModelRoutingMiddleware(app, replicas=[], self_url="")
+    scope = {"type": "http", "method": "POST", "path": "/infer/object_detection"}
+
+    # when
+    await middleware(scope, make_receive(b'{"model_id": "some/1"}'), make_send([]))
+
+    # then
+    assert app.called is True, "Routing must be disabled without replicas list"
+
+
+@pytest.mark.asyncio
+async def test_request_without_model_id_passes_through_with_body_replayed() -> None:
+    # given
+    app = EchoApp()
+    middleware = ModelRoutingMiddleware(app, replicas=REPLICAS, self_url=REPLICAS[0])
+    body = b'{"image": {"type": "url", "value": "https://some.com/image.jpg"}}'
+    scope = {"type": "http", "method": "POST", "path": "/infer/object_detection"}
+
+    # when
+    await middleware(scope, make_receive(body), make_send([]))
+
+    # then
+    assert app.called is True, "Requests without model_id must be handled locally"
+    assert app.body == body, "Consumed body must be replayed to the inner app"
+
+
+@pytest.mark.asyncio
+async def test_request_for_model_owned_by_this_replica_is_handled_locally() -> None:
+    # given
+    app = EchoApp()
+    middleware = ModelRoutingMiddleware(
+        app, replicas=REPLICAS, self_url=replica_for("some/1")
+    )
+    body = b'{"model_id": "some/1"}'
+    scope = {"type": "http", "method": "POST", "path": "/infer/object_detection"}
+
+    # when
+    await middleware(scope, make_receive(body), make_send([]))
+
+    # then
+    assert app.called is True, "Model owned by this replica must be served locally"
+    assert app.body == body, "Consumed body must be replayed to the inner app"
+
+
+@pytest.mark.asyncio
+async def test_request_for_model_owned_by_other_replica_is_redirected() -> None:
+    # given
+    app = EchoApp()
+    target_replica = replica_for("some/1")
+    middleware = ModelRoutingMiddleware(
+        app, replicas=REPLICAS, self_url=other_replica_than(target_replica)
+    )
+    sent = []
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/infer/object_detection",
+        "query_string": b"api_key=my_api_key",
+        "headers": [],
+    }
+
+    # when
+    await middleware(scope, make_receive(b'{"model_id": "some/1"}'), make_send(sent))
+
+    # then
+    assert app.called is False, "Request must not reach the inner app"
+    assert sent[0]["status"] == 307, "Redirect must preserve method and body"
+    location = dict(sent[0]["headers"])[b"location"].decode()
+    assert location == f"{target_replica}/infer/object_detection?api_key=my_api_key"
+
+
+def test_choose_replica_is_stable_across_instances() -> None:
+    # given
+    body = b'{"model_id": "some/1"}'
+    first = ModelRoutingMiddleware(EchoApp(), replicas=REPLICAS, self_url=REPLICAS[0])
+    second = ModelRoutingMiddleware(EchoApp(), replicas=REPLICAS, self_url=REPLICAS[1])
+
+    # when
+    first_choice = first._choose_replica(body=body)
+    second_choice = second._choose_replica(body=body)
+
+    # then
+    assert (
+        first_choice == second_choice
+    ), "All replicas must agree on the model placement"
@@ -0,0 +1,117 @@
+import time
+from unittest.mock import MagicMock
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.fixed_size_cache import (
+    COUNTER_SATURATION_THRESHOLD,
+    WithFixedSizeCache,
+    estimate_model_size,
+)
+
+
+def build_cache(max_size: int = 8) -> WithFixedSizeCache:
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    return WithFixedSizeCache(model_manager, max_size=max_size)
+
+
+def test_add_model_when_capacity_reached_evicts_least_utilised_model() -> None:
+    # given
+    cache = build_cache(max_size=2)
+    cache.add_model("a/1", api_key="some_api_key")
+    cache.add_model("b/1", api_key="some_api_key")
+    cache.preprocess("b/1", MagicMock())  # b/1 utilised more than a/1
+
+    # when
+    cache.add_model("c/1", api_key="some_api_key")
+
+    # then
+    assert "a/1" not in cache, "Least utilised model must be evicted"
+    assert "b/1" in cache, "More utilised model must be preserved"
+    assert "c/1" in cache, "Newly added model must be registered"
+
+
+def test_add_model_when_model_already_loaded_only_bumps_usage() -> None:
+    # given
+    cache = build_cache(max_size=2)
+    cache.add_model("a/1", api_key="some_api_key")
+
+    # when
+    cache.add_model("a/1", api_key="some_api_key")
+
+    # then
+    assert len(cache) == 1, "Model must not be registered twice"
+    assert cache._access_counts["a/1"] == 2, "Usage counter must be bumped"
+
+
+def test_mark_model_usage_when_counter_saturates() -> None:
+    # given
+    cache = build_cache()
+    cache.add_model("a/1", api_key="some_api_key")
+    cache.add_model("b/1", api_key="some_api_key")
+    cache._access_counts["a/1"] = COUNTER_SATURATION_THRESHOLD - 1
+    cache._access_counts["b/1"] = 10
+
+    # when
+    cache._mark_model_usage("a/1")
+
+    # then
+    assert (
+        cache._access_counts["a/1"] < COUNTER_SATURATION_THRESHOLD
+    ), "Counters must not grow unbounded"
+    assert cache._access_counts["b/1"] == 5, "All counters must be halved on saturation"
+    assert (
+        cache._access_counts["a/1"] > cache._access_counts["b/1"]
+    ), "Relative utilisation order must be preserved"
+
+
+def test_evict_idle_removes_only_stale_models() -> None:
+    # given
+    cache = build_cache()
+    cache.add_model("a/1", api_key="some_api_key")
+    cache.add_model("b/1", api_key="some_api_key")
+    cache._last_access["a/1"] = time.monotonic() - 100
+
+    # when
+    evicted = cache.evict_idle(ttl_secs=50)
+
+    # then
+    assert evicted == ["a/1"], "Only the model idle for longer than TTL is evicted"
+    assert "a/1" not in cache
+    assert "b/1" in cache
+
+
+def test_add_model_when_memory_budget_exceeded_evicts_despite_free_slots() -> None:
+    # given
+    cache = build_cache(max_size=8)
+    cache.add_model("a/1", api_key="some_api_key")
+    cache._model_sizes["a/1"] = 10 * 1024 * 1024
+    cache._memory_budget_bytes = 5 * 1024 * 1024
+
+    # when
+    cache.add_model("b/1", api_key="some_api_key")
+
+    # then
+    assert "a/1" not in cache, "Model must be evicted to fit the memory budget"
+    assert "b/1" in cache
+
+
+def test_estimate_model_size_sums_only_weights_artifacts(tmp_path) -> None:
+    # given
+    (tmp_path / "weights.onnx").write_bytes(b"x" * 128)
+    (tmp_path / "model.safetensors").write_bytes(b"y" * 64)
+    (tmp_path / "config.json").write_bytes(b"z" * 32)
+
+    # when
+    result = estimate_model_size(model_dir=str(tmp_path))
+
+    # then
+    assert result == 192, "Only weights files must be counted"
+
+
+def test_estimate_model_size_when_directory_does_not_exist() -> None:
+    # when
+    result = estimate_model_size(model_dir="/not/existing/dir")
+
+    # then
+    assert result == 0
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -95,23 +96,105 @@ def test_kill_containers_purges_all_containers_passed() -> None:
 @mock.patch.object(container_adapter, "docker")
 def test_find_running_inference_containers(docker_mock: MagicMock) -> None:
     # given
-    containers = [MagicMock(), MagicMock(), MagicMock()]
-    # inference container - not running
-    containers[0].image.tags = ["some", "roboflow/roboflow-inference-server-cpu:latest"]
-    containers[0].attrs = {"State": {"Status": "stopped"}}
-    # inference container - running
-    containers[1].image.tags = ["some", "roboflow/roboflow-inference-server-cpu:latest"]
-    containers[1].attrs = {"State": {"Status": "running"}}
-    # other container - running
-    containers[2].image.tags = ["some", "other"]
-    containers[2].attrs = {"State": {"Status": "running"}}
-    docker_mock.from_env.return_value.containers.list.return_value = containers
+    container_adapter._docker_client = None
+    labelled_descriptions = [
+        # started by the CLI - image referenced by digest, not by name
+        {"Id": "c0", "Image": "sha256:abcdef"},
+    ]
+    all_descriptions = [
+        {"Id": "c0", "Image": "sha256:abcdef"},
+        # unlabelled inference container - not running anymore at inspection time
+        {"Id": "c1", "Image": "roboflow/roboflow-inference-server-cpu:latest"},
+        # unlabelled inference container - running
+        {"Id": "c2", "Image": "roboflow/roboflow-inference-server-gpu:latest"},
+        # other container - running
+        {"Id": "c3", "Image": "some/other:latest"},
+    ]
+
+    def containers_endpoint(all=False, filters=None):
+        if filters is not None:
+            return list(labelled_descriptions)
+        return list(all_descriptions)
+
+    docker_mock.from_env.return_value.api.containers.side_effect = containers_endpoint
+    labelled_container = build_container_mock(
+        image="sha256:abcdef", status="running", tags=[]
+    )
+    stopped_container = build_container_mock(
+        image="roboflow/roboflow-inference-server-cpu:latest", status="stopped"
+    )
+    running_container = build_container_mock(
+        image="roboflow/roboflow-inference-server-gpu:latest", status="running"
+    )
+    other_container = build_container_mock(
+        image="some/other:latest", status="running", tags=["some/other:latest"]
+    )
+    containers_by_id = {
+        "c0": labelled_container,
+        "c1": stopped_container,
+        "c2": running_container,
+        "c3": other_container,
+    }
+    docker_mock.from_env.return_value.containers.get.side_effect = (
+        containers_by_id.__getitem__
+    )
 
     # when
     result = find_running_inference_containers()
 
     # then
-    assert result == [containers[1]]
+    assert result == [
+        labelled_container,
+        running_container,
+    ], "Labelled and unlabelled (legacy) containers must both be discovered"
+
+
+@mock.patch.object(container_adapter, "docker")
+def test_find_running_inference_containers_recognises_digest_referenced_image(
+    docker_mock: MagicMock,
+) -> None:
+    # given
+    container_adapter._docker_client = None
+    descriptions = [
+        # unlabelled container started from the image referenced by digest -
+        # only the tags reveal it is an inference server
+        {"Id": "c1", "Image": "sha256:abcdef"},
+    ]
+
+    def containers_endpoint(all=False, filters=None):
+        if filters is not None:
+            return []
+        return list(descriptions)
+
+    docker_mock.from_env.return_value.api.containers.side_effect = containers_endpoint
+    digest_container = build_container_mock(
+        image="sha256:abcdef",
+        status="running",
+        tags=["roboflow/roboflow-inference-server-cpu:latest"],
+    )
+    docker_mock.from_env.return_value.containers.get.side_effect = {
+        "c1": digest_container
+    }.__getitem__
+
+    # when
+    result = find_running_inference_containers()
+
+    # then
+    assert result == [
+        digest_container
+    ], "Container must be recognised through the image tags fallback"
+
+
+def build_container_mock(
+    image: str, status: str, tags: Optional[List[str]] = None
+) -> MagicMock:
+    container = MagicMock()
+    container.attrs = {
+        "Config": {"Image": image},
+        "State": {"Status": status},
+    }
+    container.image.tags = tags if tags is not None else [image]
+    return container
 
 
 @mock.patch.object(container_adapter, "ask_user_to_kill_container")
@@ -1,10 +1,16 @@
+from copy import deepcopy
+
 import numpy as np
+import pytest
 import supervision as sv
 
-from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
+from inference.core.env import MAX_ACTIVE_MODELS, WORKFLOWS_MAX_CONCURRENT_STEPS
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.models.utils import ROBOFLOW_MODEL_TYPES
 
 TOP_PREDICTION_WORKFLOW = {
     "version": "1.0",
@@ -57,7 +63,10 @@ EXPECTED_OBJECT_DETECTION_BBOXES = np.array(
         [341, 261, 362, 338],
         [247, 251, 262, 284],
         [239, 251, 249, 282],
-    ]
+    ],
+    # float32 matches the dtype of model outputs, so np.allclose compares
+    # without upcasting either side to float64
+    dtype=np.float32,
 )
 EXPECTED_OBJECT_DETECTION_CONFIDENCES = np.array(
     [
@@ -73,28 +82,43 @@ EXPECTED_OBJECT_DETECTION_CONFIDENCES = np.array(
         0.56938,
         0.54092,
         0.43511,
-    ]
+    ],
+    dtype=np.float32,
 )
+# free views over the arrays above - no per-test allocation needed
+EXPECTED_TOP_BBOX = EXPECTED_OBJECT_DETECTION_BBOXES[:1]
+EXPECTED_TOP_CONFIDENCE = EXPECTED_OBJECT_DETECTION_CONFIDENCES[:1]
 
 
-def test_filtering_workflow_to_include_only_top_prediction(
-    model_manager: ModelManager,
-    crowd_image: np.ndarray,
-) -> None:
-    # given
+@pytest.fixture(scope="module")
+def top_prediction_engine() -> ExecutionEngine:
+    # compiling TOP_PREDICTION_WORKFLOW in ExecutionEngine.init() is the
+    # expensive part of this module's tests - one engine is shared, which is
+    # safe as run() does not mutate engine state between invocations
+    model_manager = WithFixedSizeCache(
+        ModelManager(model_registry=RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)),
+        max_size=MAX_ACTIVE_MODELS,
+    )
     workflow_init_parameters = {
         "workflows_core.model_manager": model_manager,
         "workflows_core.api_key": None,
         "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
     }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=TOP_PREDICTION_WORKFLOW,
+    # the compiled workflow keeps a reference to the raw definition - hand
+    # the engine its own copy so the module constant stays pristine
+    return ExecutionEngine.init(
+        workflow_definition=deepcopy(TOP_PREDICTION_WORKFLOW),
         init_parameters=workflow_init_parameters,
         max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
     )
 
+
+def test_filtering_workflow_to_include_only_top_prediction(
+    top_prediction_engine: ExecutionEngine,
+    crowd_image: np.ndarray,
+) -> None:
     # when
-    result = execution_engine.run(
+    result = top_prediction_engine.run(
         runtime_parameters={
             "image": crowd_image,
             "model_id": "yolov8n-640",
@@ -112,7 +136,7 @@ def test_filtering_workflow_to_include_only_top_prediction(
     assert np.allclose(
         all_detections.xyxy,
         EXPECTED_OBJECT_DETECTION_BBOXES,
-        atol=1,
+        atol=1.0,
     ), "Expected bboxes to match what was validated manually as workflow outcome"
     assert np.allclose(
         all_detections.confidence,
@@ -123,34 +147,22 @@ def test_filtering_workflow_to_include_only_top_prediction(
     assert len(top_detections) == 1, "Expected only one top prediction"
     assert np.allclose(
         top_detections.xyxy,
-        [EXPECTED_OBJECT_DETECTION_BBOXES[0]],
-        atol=1,
+        EXPECTED_TOP_BBOX,
+        atol=1.0,
     ), "Expected top bbox to match what was validated manually as workflow outcome"
     assert np.allclose(
         top_detections.confidence,
-        [EXPECTED_OBJECT_DETECTION_CONFIDENCES[0]],
+        EXPECTED_TOP_CONFIDENCE,
         atol=0.01,
     ), "Expected top confidence to match what was validated manually as workflow outcome"
 
 
 def test_filtering_workflow_by_top_prediction_with_no_detections(
-    model_manager: ModelManager,
+    top_prediction_engine: ExecutionEngine,
     red_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=TOP_PREDICTION_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
-    result = execution_engine.run(
+    result = top_prediction_engine.run(
         runtime_parameters={
             "image": red_image,
             "model_id": "yolov8n-640",
@@ -1,9 +1,15 @@
+from copy import deepcopy
+
 import numpy as np
+import pytest
 
-from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
+from inference.core.env import MAX_ACTIVE_MODELS, WORKFLOWS_MAX_CONCURRENT_STEPS
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.models.utils import ROBOFLOW_MODEL_TYPES
 from tests.workflows.integration_tests.execution.workflows_gallery_collector.decorators import (
     add_to_workflows_gallery,
 )
@@ -80,6 +86,28 @@ WORKFLOW_WITH_SIFT = {
 }
 
 
+@pytest.fixture(scope="module")
+def sift_workflow_engine() -> ExecutionEngine:
+    # compiling WORKFLOW_WITH_SIFT in ExecutionEngine.init() dominates the
+    # test runtime - one engine is shared, which is safe as run() does not
+    # mutate engine state between invocations
+    model_manager = WithFixedSizeCache(
+        ModelManager(model_registry=RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)),
+        max_size=MAX_ACTIVE_MODELS,
+    )
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    # the compiled workflow keeps a reference to the raw definition - hand
+    # the engine its own copy so the module constant stays pristine
+    return ExecutionEngine.init(
+        workflow_definition=deepcopy(WORKFLOW_WITH_SIFT),
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+    )
+
+
 @add_to_workflows_gallery(
     category="Workflows with classical Computer Vision methods",
     use_case_title="SIFT in Workflows",
@@ -104,25 +132,18 @@ Execution Engine capabilities to broadcast batch-oriented inputs properly.
     workflow_name_in_app="sift",
 )
 def test_workflow_with_classical_pattern_matching(
-    model_manager: ModelManager,
+    sift_workflow_engine: ExecutionEngine,
     dogs_image: np.ndarray,
     crowd_image: np.ndarray,
 ) -> None:
     # given
-    template = np.ascontiguousarray(dogs_image[::-1, ::-1], dtype=np.uint8)
+    # np.rot90(..., 2) is a view - only the final .copy() touches pixel data,
+    # and it already yields a contiguous uint8 array
+    template = np.rot90(dogs_image, 2).copy()
     empty_image_without_descriptors = np.zeros((256, 256, 3), dtype=np.uint8)
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=WORKFLOW_WITH_SIFT,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
 
     # when
-    result = execution_engine.run(
+    result = sift_workflow_engine.run(
         runtime_parameters={
             "image": [crowd_image, dogs_image, empty_image_without_descriptors],
             "template": template,
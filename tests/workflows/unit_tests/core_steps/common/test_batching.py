@@ -0,0 +1,181 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from inference.core.workflows.core_steps.common.batching import (
+    AdaptiveBatcher,
+    get_batcher,
+)
+
+
+def test_submit_when_single_caller_and_no_wait_window() -> None:
+    # given
+    batcher = AdaptiveBatcher(
+        batch_handler=lambda payloads: [payload * 2 for payload in payloads],
+        max_wait_ms=0,
+    )
+
+    # when
+    result = batcher.submit(21)
+
+    # then
+    assert result == 42, "Lone caller must be processed immediately"
+
+
+def test_submit_when_lone_caller_uses_wait_window() -> None:
+    # given
+    batcher = AdaptiveBatcher(
+        batch_handler=lambda payloads: [payload + 1 for payload in payloads],
+        max_wait_ms=10,
+    )
+
+    # when
+    result = batcher.submit(1)
+
+    # then
+    assert result == 2, "Caller must be processed once the wait window expires"
+
+
+def test_submissions_during_in_flight_batch_are_coalesced() -> None:
+    # given
+    gate = threading.Event()
+    batch_sizes: List[int] = []
+
+    def batch_handler(payloads: List[int]) -> List[int]:
+        batch_sizes.append(len(payloads))
+        if len(batch_sizes) == 1:
+            gate.wait(timeout=5)
+        return [payload * 2 for payload in payloads]
+
+    batcher = AdaptiveBatcher(batch_handler=batch_handler, max_wait_ms=0)
+    results = {}
+
+    def submit(value: int) -> None:
+        results[value] = batcher.submit(value)
+
+    # when
+    first_caller = threading.Thread(target=submit, args=(1,))
+    first_caller.start()
+    while not batch_sizes:  # first batch must be in flight before followers queue
+        time.sleep(0.01)
+    followers = [threading.Thread(target=submit, args=(value,)) for value in (2, 3)]
+    for follower in followers:
+        follower.start()
+    while len(batcher._pending) < 2:
+        time.sleep(0.01)
+    gate.set()
+    first_caller.join(timeout=5)
+    for follower in followers:
+        follower.join(timeout=5)
+
+    # then
+    assert results == {1: 2, 2: 4, 3: 6}, "Each caller must get its own result"
+    assert batch_sizes == [1, 2], "Payloads queued mid-flight must form one batch"
+
+
+def test_concurrent_callers_within_wait_window_share_one_batch() -> None:
+    # given
+    batch_sizes: List[int] = []
+
+    def batch_handler(payloads: List[int]) -> List[int]:
+        batch_sizes.append(len(payloads))
+        return [payload * 10 for payload in payloads]
+
+    batcher = AdaptiveBatcher(batch_handler=batch_handler, max_wait_ms=500)
+    results = {}
+
+    def submit(value: int) -> None:
+        results[value] = batcher.submit(value)
+
+    # when
+    threads = [threading.Thread(target=submit, args=(value,)) for value in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # then
+    assert results == {1: 10, 2: 20}, "Each caller must get its own result"
+    assert batch_sizes == [2], "Both payloads must be dispatched as a single batch"
+
+
+def test_max_batch_size_caps_coalesced_batches() -> None:
+    # given
+    batch_sizes: List[int] = []
+
+    def batch_handler(payloads: List[int]) -> List[int]:
+        batch_sizes.append(len(payloads))
+        return payloads
+
+    batcher = AdaptiveBatcher(
+        batch_handler=batch_handler, max_batch_size=2, max_wait_ms=500
+    )
+
+    # when
+    threads = [
+        threading.Thread(target=batcher.submit, args=(value,)) for value in (1, 2, 3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # then
+    assert sorted(batch_sizes) == [1, 2], "Batches must not exceed max_batch_size"
+
+
+def test_handler_exception_propagates_to_every_waiter() -> None:
+    # given
+    def batch_handler(payloads: List[int]) -> List[int]:
+        raise RuntimeError("boom")
+
+    batcher = AdaptiveBatcher(batch_handler=batch_handler, max_wait_ms=500)
+    errors: List[Exception] = []
+
+    def submit(value: int) -> None:
+        try:
+            batcher.submit(value)
+        except RuntimeError as error:
+            errors.append(error)
+
+    # when
+    threads = [threading.Thread(target=submit, args=(value,)) for value in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    # then
+    assert len(errors) == 2, "Each waiter in the failed batch must see the error"
+    assert all(str(error) == "boom" for error in errors)
+
+
+def test_get_batcher_returns_shared_instance_per_key() -> None:
+    # given
+    handler = lambda payloads: payloads
+
+    # when
+    first = get_batcher(key="test_batching-model/1", batch_handler=handler)
+    second = get_batcher(key="test_batching-model/1", batch_handler=handler)
+    other = get_batcher(key="test_batching-model/2", batch_handler=handler)
+
+    # then
+    assert first is second, "Same key must yield the shared batcher"
+    assert first is not other, "Different keys must not share a batcher"
+
+
+def test_get_batcher_separates_batchers_per_manager_identity() -> None:
+    # given
+    handler = lambda payloads: payloads
+    first_manager, second_manager = object(), object()
+
+    # when
+    first = get_batcher(key=(id(first_manager), "model/1"), batch_handler=handler)
+    second = get_batcher(key=(id(second_manager), "model/1"), batch_handler=handler)
+
+    # then
+    assert (
+        first is not second
+    ), "Handlers bound to different managers must not share a batcher"
@@ -604,7 +604,7 @@ def test_get_class_of_least_confident_detection() -> None:
     assert result == ("a", 0)
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_merge_detections(uuid4_mock: MagicMock) -> None:
     # given
     uuid4_mock.return_value = "some_uuid"
@@ -1269,7 +1269,7 @@ def test_does_not_detect_objects_in_any_source_when_not_all_sources_give_empty_p
     assert result is False
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_get_consensus_for_single_detection_when_only_single_source_and_single_source_is_enough(
     uuid_mock: MagicMock,
 ) -> None:
@@ -1390,7 +1390,7 @@ def test_get_consensus_for_single_detection_when_only_single_source_and_single_s
     assert consensus_detections == []
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_and_all_other_conditions_should_pass(
     uuid_mock: MagicMock,
 ) -> None:
@@ -1556,7 +1556,7 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
     assert consensus_detections == []
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_but_confidence_is_not_enough(
     uuid_mock: MagicMock,
 ) -> None:
@@ -1627,7 +1627,7 @@ def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_b
     assert consensus_detections == []
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_get_consensus_for_single_detection_when_only_multiple_sources_matches_but_classes_do_not_match(
     uuid_mock: MagicMock,
 ) -> None:
@@ -1953,7 +1953,7 @@ def test_agree_on_consensus_for_all_detections_sources_when_predictions_do_not_m
     assert result == ("some_parent", False, {}, empty_detections)
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_agree_on_consensus_for_all_detections_sources_when_predictions_from_single_source_given_but_thats_enough_for_consensus(
     uuid_mock: MagicMock,
 ) -> None:
@@ -2019,7 +2019,7 @@ def test_agree_on_consensus_for_all_detections_sources_when_predictions_from_sin
     assert result == ("some_parent", True, {"b": 0.9}, expected_consensus_detections)
 
 
-@mock.patch.object(v1, "uuid4")
+@mock.patch.object(v1, "generate_detection_id")
 def test_agree_on_consensus_for_all_detections_sources_when_predictions_from_multiple_sources_given_enough_for_consensus(
     uuid_mock: MagicMock,
 ) -> None:
@@ -0,0 +1,92 @@
+import numpy as np
+from supervision.detection.utils import box_iou_batch
+
+from inference.core.workflows.core_steps.fusion.detections_consensus.iou_matching import (
+    iou_one_to_many,
+    iou_one_to_many_numpy,
+)
+
+
+def calculate_areas(boxes: np.ndarray) -> np.ndarray:
+    return (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+
+
+def test_iou_kernel_matches_supervision_reference() -> None:
+    # given
+    rng = np.random.default_rng(seed=42)
+    corners = rng.uniform(0, 500, size=(32, 2, 2))
+    boxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1).astype(
+        np.float64
+    )
+    box = boxes[0]
+    expected = box_iou_batch(box[np.newaxis, :], boxes)[0]
+
+    # when
+    result = iou_one_to_many(
+        box, boxes, calculate_areas(box[np.newaxis, :])[0], calculate_areas(boxes)
+    )
+
+    # then
+    assert np.allclose(
+        result, expected, atol=1e-6
+    ), "Kernel must reproduce sv.box_iou_batch results"
+
+
+def test_active_kernel_matches_numpy_fallback() -> None:
+    # given
+    rng = np.random.default_rng(seed=7)
+    corners = rng.uniform(0, 100, size=(16, 2, 2))
+    boxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1).astype(
+        np.float64
+    )
+    box = boxes[3]
+    box_area = calculate_areas(box[np.newaxis, :])[0]
+    boxes_areas = calculate_areas(boxes)
+
+    # when
+    active_result = iou_one_to_many(box, boxes, box_area, boxes_areas)
+    fallback_result = iou_one_to_many_numpy(box, boxes, box_area, boxes_areas)
+
+    # then
+    assert np.allclose(
+        active_result, fallback_result, atol=1e-9
+    ), "numba and numpy implementations must agree"
+
+
+def test_iou_for_non_overlapping_boxes() -> None:
+    # given
+    box = np.array([0.0, 0.0, 10.0, 10.0])
+    boxes = np.array([[20.0, 20.0, 30.0, 30.0]])
+
+    # when
+    result = iou_one_to_many(box, boxes, 100.0, np.array([100.0]))
+
+    # then
+    assert np.allclose(result, [0.0])
+
+
+def test_iou_for_identical_boxes() -> None:
+    # given
+    box = np.array([5.0, 5.0, 15.0, 25.0])
+    boxes = np.array([[5.0, 5.0, 15.0, 25.0]])
+
+    # when
+    result = iou_one_to_many(box, boxes, 200.0, np.array([200.0]))
+
+    # then
+    assert np.allclose(result, [1.0])
+
+
+def test_iou_for_degenerate_boxes_reports_zero_without_nan() -> None:
+    # given - zero-area boxes make the union zero
+    box = np.array([10.0, 10.0, 10.0, 10.0])
+    boxes = np.array([[10.0, 10.0, 10.0, 10.0], [0.0, 0.0, 5.0, 5.0]])
+
+    # when
+    result = iou_one_to_many(box, boxes, 0.0, np.array([0.0, 25.0]))
+    fallback_result = iou_one_to_many_numpy(box, boxes, 0.0, np.array([0.0, 25.0]))
+
+    # then
+    assert np.all(np.isfinite(result)), "Degenerate pairs must not produce NaN/inf"
+    assert np.allclose(result, [0.0, 0.0])
+    assert np.allclose(fallback_result, [0.0, 0.0])
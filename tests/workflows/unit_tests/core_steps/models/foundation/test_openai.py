@@ -1,8 +1,10 @@
+import base64
 import json
 import time
 from typing import Any
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
@@ -487,3 +489,52 @@ def test_execute_gpt_4v_request_gpt_4o_mini() -> None:
     assert (
         call_kwargs["messages"][0]["content"][1]["image_url"]["detail"] == "high"
     ), "Image details level expected to be set to `low` as in LMMConfig"
+
+
+def test_execute_gpt_4v_request_when_prefixed_base64_image_given() -> None:
+    # given
+    client = MagicMock()
+    client.chat.completions.create.return_value = ChatCompletion(
+        id="38",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(
+                    role="assistant",
+                    content="This is content from GPT",
+                ),
+            )
+        ],
+        created=int(time.time()),
+        model="gpt-4o",
+        object="chat.completion",
+    )
+    _, encoded_image = cv2.imencode(".jpg", np.zeros((192, 168, 3), dtype=np.uint8))
+    base64_value = base64.b64encode(encoded_image).decode("ascii")
+
+    # when
+    result = execute_gpt_4v_request(
+        client=client,
+        image={
+            "type": "base64",
+            "value": f"data:image/png;base64,{base64_value}",
+        },
+        prompt="My prompt",
+        lmm_config=LMMConfig(
+            gpt_model_version="gpt-4o",
+            gpt_image_detail="low",
+            max_tokens=600,
+        ),
+    )
+
+    # then
+    assert result == {
+        "content": "This is content from GPT",
+        "image": {"width": 168, "height": 192},
+    }
+    call_kwargs = client.chat.completions.create.call_args[1]
+    assert (
+        call_kwargs["messages"][0]["content"][1]["image_url"]["url"]
+        == f"data:image/jpeg;base64,{base64_value}"
+    ), "Data-url prefix from the input must not be doubled in the image URL"